@@ -7,147 +7,169 @@ import asyncio
 import json
 import os
 import sys
-from typing import Any
-from urllib.parse import quote
-
-# Third party imports
-from playwright.async_api import async_playwright
 
 # Local imports
-from scripts.google.get_google_sheets_service import get_google_sheets_service
-from scripts.google.read_from_sheets import read_from_sheets
-from scripts.google.write_to_sheets import write_to_sheets
-from scripts.linkedin.ensure_login import ensure_linkedin_login
-from scripts.linkedin.login_with_linkedin import login_linkedin
-from scripts.linkedin.search_jobs import search_linkedin_jobs
+from scripts.linkedin.browser_session import BrowserSession
+from scripts.linkedin.company_url_cache import load_company_urls, save_company_urls
+from scripts.linkedin.create_context import load_storage_state
+from scripts.linkedin.crawl_state import CrawlState
+from scripts.linkedin.crawl_watermark import save_watermark
+from scripts.linkedin.enrich_jobs import JobEnricher
+from scripts.linkedin.http_search import (
+    FETCH_ENGINE,
+    HttpFetchError,
+    HttpSearchClient,
+    scrape_keyword_http,
+)
+from scripts.linkedin.scrape_keyword import scrape_keyword
+from scripts.linkedin.search_query import SearchQuery
 from scripts.slack.slack import slack
+from scripts.storage.get_job_storage import get_job_storage
+from scripts.storage.job_journal import JobJournal
+from scripts.storage.job_writer import JobWriter
+from scripts.storage.known_job_ids import KnownJobIds
+from utils.call_metrics import CALL_METRICS_ENABLED, get_call_metrics
+from utils.keyword_scheduler import record_keyword_run
+from utils.local_cache import REPLAY
+from utils.run_profiler import run_profiler
 
+# Number of keywords scraped at the same time in multi-keyword mode
+KEYWORD_CONCURRENCY = int(os.getenv("KEYWORD_CONCURRENCY", "2"))
 
-async def main():
-    # Get the keyword from command line arguments or environment variable
-    keyword = os.getenv("SEARCH_KEYWORD", "Test Automation Engineer")
-    if len(sys.argv) > 1:
-        keyword = sys.argv[1]
-
-    print(f"Using search keyword: {keyword}")
-
-    async with async_playwright() as p:
-        # Launch browser in headless mode based on environment
-        env = os.getenv("ENV", "")
-        is_local = env.lower() == "local"
 
-        # Always run headless in GitHub Actions
-        browser = await p.chromium.launch(headless=not is_local)
-        user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"  # noqa: E501
+def load_keywords() -> list[str]:
+    with open("keywords.json", "r", encoding="utf-8") as keyword_file:
+        return json.load(keyword_file)
 
-        context_options: dict[str, Any] = {}
 
-        # For local development, use local auth file
-        if is_local:
-            auth_file = os.path.join(
-                os.path.expanduser("~"), "Downloads", "linkedin-auth.json"
+async def main():
+    # Scrape every keyword in keywords.json with: python -m main --all-keywords
+    args = [arg for arg in sys.argv[1:] if arg != "--all-keywords"]
+    all_keywords = len(args) < len(sys.argv[1:]) or (
+        os.getenv("SEARCH_ALL_KEYWORDS", "").lower() == "true"
+    )
+
+    if all_keywords:
+        keywords = load_keywords()
+    else:
+        # Get the keyword from command line arguments or environment variable
+        keyword = os.getenv("SEARCH_KEYWORD", "Test Automation Engineer")
+        if args:
+            keyword = args[0]
+        keywords = [keyword]
+
+    print(f"Using search keywords: {', '.join(keywords)}")
+
+    # The browser starts on first use; FETCH_ENGINE=http only needs it to fall back
+    storage_state = load_storage_state()
+    session = BrowserSession(storage_state)
+    client = HttpSearchClient(storage_state) if FETCH_ENGINE == "http" else None
+    company_urls = load_company_urls()
+
+    try:
+        # The browser engine checks the session on /feed/ before anything else, so a revoked one
+        # is logged in again, or fails, before any keyword starts
+        if client is None:
+            await session.get_context()
+
+        # Google Sheets or local SQLite, picked by STORAGE_BACKEND
+        with run_profiler.phase("storage_load"):
+            storage = get_job_storage()
+
+        # Stored ids plus those scraped in this run, so later pages and keywords skip them too
+        shared = CrawlState(company_urls=company_urls, seen_ids=KnownJobIds(storage))
+        semaphore = asyncio.Semaphore(KEYWORD_CONCURRENCY)
+
+        async def run_keyword(keyword: str):
+            query = SearchQuery(keyword)
+            async with semaphore:
+                if client:
+                    try:
+                        return await scrape_keyword_http(client, query, shared, sink)
+                    except HttpFetchError as e:
+                        print(f"HTTP engine failed for '{keyword}', using the browser: {e}")
+                return await scrape_keyword(await session.get_context(), query, shared, sink)
+
+        # Every scraped job is journaled locally before it is buffered for storage
+        journal = JobJournal()
+
+        # Jobs are appended in batches from a worker thread while we keep scraping
+        async with JobWriter(storage, journal) as writer:
+            # Jobs scraped by a run that died before storing them, stored without re-scraping
+            pending_jobs = journal.pending_jobs()
+            if pending_jobs:
+                print(f"Replaying {len(pending_jobs)} unstored jobs from the job journal")
+                writer.put(pending_jobs, journal=False)
+
+            # With ENRICH_JOBS, new jobs get their job page's details on the way to the writer
+            async with JobEnricher(session.get_context, writer) as sink:
+                results = await asyncio.gather(
+                    *(run_keyword(keyword) for keyword in keywords),
+                    return_exceptions=True,
+                )
+
+        total_new_jobs = writer.new_jobs_count
+        skipped_count = 0
+        errors: list[BaseException] = []
+        for keyword, result in zip(keywords, results):
+            if isinstance(result, BaseException):
+                print(f"Failed to scrape keyword '{keyword}': {result}")
+                errors.append(result)
+                continue
+
+            # Remember the newest ids so the next run can stop early
+            save_watermark(keyword, result.watermark_candidates)
+            # Yield and cost of this run, for select_keyword to schedule the next ones
+            record_keyword_run(
+                keyword,
+                result.found_count,
+                len(result.scanned_ids),
+                result.elapsed_seconds,
             )
-            if os.path.exists(auth_file):
-                print(f"Loading storage state from {auth_file}")
-                with open(auth_file, "r", encoding="utf-8") as f:
-                    storage_state = json.load(f)
-                    context_options["storage_state"] = storage_state
-
-        # For GitHub Actions, use LINKEDIN_AUTH_JSON environment variable
+            skipped_count += result.skipped_count
+
+        # Everything is stored, so only cursors of failed keywords stay in the journal
+        journal.compact(
+            keyword
+            for keyword, result in zip(keywords, results)
+            if not isinstance(result, BaseException)
+        )
+        journal.close()
+
+        # Get total jobs count from the storage instead of re-reading the sheet
+        total_jobs = storage.count()
+        storage.close()
+
+        # Send Slack notification
+        keywords_label = ", ".join(f"'{keyword}'" for keyword in keywords)
+        message = (
+            f"Job Search Results for {keywords_label}:\n"
+            f"• New jobs added: {total_new_jobs}\n"
+            f"• Known jobs skipped: {skipped_count}\n"
+            f"• Total jobs in database: {total_jobs}"
+        )
+        if run_profiler.enabled:
+            message += f"\n• {run_profiler.slack_line()}"
+        # A HAR replay is a rehearsal, so it has nothing to announce
+        if REPLAY:
+            print(message)
         else:
-            linkedin_auth_json = os.getenv("LINKEDIN_AUTH_JSON")
-            if linkedin_auth_json:
-                try:
-                    storage_state = json.loads(linkedin_auth_json)
-                    print(
-                        "Loaded LinkedIn auth from LINKEDIN_AUTH_JSON environment variable"
-                    )
-                    context_options["storage_state"] = storage_state
-                except Exception as e:
-                    print(f"Failed to parse LINKEDIN_AUTH_JSON: {e}")
-
-        context = await browser.new_context(user_agent=user_agent, **context_options)
-        page = await context.new_page()
-
-        try:
-            if not context_options:
-                print("No auth state found, performing login...")
-                await login_linkedin(page)
-
-            # Ensure logged in before searching
-            await ensure_linkedin_login(page)
-
-            # Get Google Sheets service
-            sheets_service = get_google_sheets_service()
-
-            # Use SPREADSHEET_ID from environment if available, otherwise fail
-            spreadsheet_id = os.getenv("SPREADSHEET_ID")
-            if not spreadsheet_id:
-                raise ValueError("SPREADSHEET_ID environment variable is required")
-
-            # Encode keyword for URL
-            encoded_keyword = quote(keyword)
-
-            # Build the search URL with filters
-            base_url = "https://www.linkedin.com/jobs/search/"
-            filters = {
-                # Job titles filter
-                "f_T": quote("11227,13936,4729,264,661,20648,1510"),
-                "geoId": "103644278",  # United States
-                "keywords": encoded_keyword,
-            }
-
-            # Construct URL with parameters
-            url_params = "&".join([f"{k}={v}" for k, v in filters.items()])
-            url = f"{base_url}?{url_params}"
-
-            print(f"\nFetching page 1 for keyword: {keyword}")
-            await page.goto(url)
-            await page.wait_for_load_state("domcontentloaded")
-            await page.wait_for_timeout(2000)
-
-            # Get jobs from first page
-            jobs = await search_linkedin_jobs(page, keyword)
-            print(f"Found {len(jobs)} jobs on page 1")
-            new_jobs_count = write_to_sheets(sheets_service, spreadsheet_id, jobs)
-            total_new_jobs = new_jobs_count
-
-            # Only fetch additional pages when running locally
-            if is_local:
-                # Get jobs from pages 2 to 4
-                for page_num in range(2, 5):
-                    print(f"Fetching page {page_num}")
-
-                    # Click pagination button
-                    next_page_button = f'button[aria-label="Page {page_num}"]'
-                    await page.wait_for_selector(next_page_button)
-                    await page.click(next_page_button)
-                    await page.wait_for_load_state("domcontentloaded")
-                    await page.wait_for_timeout(3000)  # Wait for page transition
-
-                    # Get jobs
-                    jobs = await search_linkedin_jobs(page, keyword)
-                    print(f"Found {len(jobs)} jobs on page {page_num}")
-                    new_jobs_count = write_to_sheets(
-                        sheets_service, spreadsheet_id, jobs
-                    )
-                    total_new_jobs += new_jobs_count
-
-            # Get total jobs count
-            existing_jobs = read_from_sheets(sheets_service, spreadsheet_id)
-            total_jobs = len(existing_jobs)
-
-            # Send Slack notification
-            slack(
-                f"Job Search Results for '{keyword}':\n"
-                f"• New jobs added: {total_new_jobs}\n"
-                f"• Total jobs in database: {total_jobs}"
-            )
+            with run_profiler.phase("slack_post"):
+                slack(message)
+
+        if errors:
+            raise errors[0]
 
-        finally:
-            await browser.close()
+    finally:
+        if CALL_METRICS_ENABLED:
+            print(json.dumps(get_call_metrics(), indent=2))
+        run_profiler.report()
+        save_company_urls(company_urls)
+        if client:
+            client.close()
+        await session.close()
 
 
 if __name__ == "__main__":
-    # Run the script with: python -m main [keyword]
+    # Run the script with: python -m main [keyword] or python -m main --all-keywords
     asyncio.run(main())
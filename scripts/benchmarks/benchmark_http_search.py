@@ -0,0 +1,111 @@
+# Standard imports
+import asyncio
+import contextlib
+import io
+import os
+import resource
+import time
+import tracemalloc
+from typing import Any
+from urllib.parse import quote
+
+# Third party imports
+from playwright.async_api import async_playwright
+
+# Local imports
+from scripts.benchmarks.fixture_server import serve_fixtures
+from scripts.linkedin.crawl_state import CrawlState
+from scripts.linkedin.build_search_url import JOBS_PER_PAGE
+from scripts.linkedin.http_search import SEARCH_FRAGMENT_PATH, HttpSearchClient, scrape_keyword_http
+from scripts.linkedin.parse_job_cards import parse_jobs
+from scripts.linkedin.search_query import SearchQuery
+from scripts.storage.job_storage import JOB_COLUMNS
+
+# Queries per engine, and the results each one has (25 per page, up to MAX_PAGES pages)
+QUERY_COUNT = int(os.getenv("BENCHMARK_QUERIES", "20"))
+RESULT_COUNT = int(os.getenv("BENCHMARK_RESULTS", "60"))
+
+
+class CollectingWriter:
+    journal = None
+
+    def __init__(self):
+        self.jobs: list[dict[str, Any]] = []
+
+    def put(
+        self,
+        jobs: list[dict[str, Any]],
+        page_num: int = 0,
+        journal: bool = True,
+        query_key: str = "",
+    ):
+        self.jobs.extend(jobs)
+
+
+def print_result(label: str, elapsed: float, jobs: int, requests: int, memory: str):
+    print(
+        f"{label:<24} {elapsed * 1000:9.1f} ms  {elapsed * 1000 / QUERY_COUNT:8.1f} ms/query"
+        f"  {jobs:5d} jobs  {requests:4d} requests  {memory}"
+    )
+
+
+async def benchmark_http(base_url: str, requests: list[str]):
+    """scrape_keyword_http for every query, fresh state each so every card is new"""
+    client = HttpSearchClient(base_url=base_url)
+    writer = CollectingWriter()
+    requests.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for n in range(QUERY_COUNT):
+            await scrape_keyword_http(client, SearchQuery(f"QA Engineer {n}"), CrawlState(), writer)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    client.close()
+
+    assert all(list(job) == JOB_COLUMNS for job in writer.jobs), "HTTP jobs differ from the schema"
+    assert len(writer.jobs) == QUERY_COUNT * RESULT_COUNT, f"Expected {RESULT_COUNT} jobs per query"
+    print_result("http engine", elapsed, len(writer.jobs), len(requests), f"{peak / 1024:.0f} KiB heap peak")
+
+
+async def benchmark_browser(base_url: str, requests: list[str]):
+    """Same fragments through Chromium: launch once, then goto and page.content() per page"""
+    requests.clear()
+    jobs_count = 0
+    start = time.perf_counter()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        launched = time.perf_counter()
+        page = await browser.new_page()
+        for n in range(QUERY_COUNT):
+            keyword = f"QA Engineer {n}"
+            for start_offset in range(0, RESULT_COUNT, JOBS_PER_PAGE):
+                await page.goto(
+                    f"{base_url}{SEARCH_FRAGMENT_PATH}?keywords={quote(keyword)}&start={start_offset}"
+                )
+                jobs_count += len(parse_jobs(await page.content(), keyword))
+        await browser.close()
+    elapsed = time.perf_counter() - start
+
+    # Chromium runs in child processes, which report their peak once they have exited
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    print_result(
+        "browser (cards only)",
+        elapsed,
+        jobs_count,
+        len(requests),
+        f"{children_rss / 1024:.0f} MiB largest child RSS, launch {(launched - start) * 1000:.0f} ms",
+    )
+
+
+async def main():
+    print(f"{QUERY_COUNT} queries of {RESULT_COUNT} results from a local fixture server")
+    with serve_fixtures(RESULT_COUNT) as (base_url, requests):
+        await benchmark_http(base_url, requests)
+        await benchmark_browser(base_url, requests)
+
+
+if __name__ == "__main__":
+    # Run the benchmark with: python -m scripts.benchmarks.benchmark_http_search
+    asyncio.run(main())
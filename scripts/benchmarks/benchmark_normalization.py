@@ -0,0 +1,116 @@
+# Standard imports
+import glob
+import os
+import re
+import sys
+import time
+
+# Third party imports
+from bs4 import BeautifulSoup
+
+# Local imports
+from utils.clean_company_name import (
+    COMPANY_NAME_NORMALIZER,
+    COMPANY_NAME_PATTERNS,
+    clean_company_names,
+)
+from utils.clean_job_title import (
+    JOB_TITLE_NORMALIZER,
+    JOB_TITLE_PATTERNS,
+    clean_job_titles,
+)
+
+# Cleaned inputs per run, drawn from the corpus so repeats look like a real backfill
+BENCHMARK_SIZE = int(os.getenv("BENCHMARK_SIZE", "100000"))
+
+# The documented examples plus edge cases where pattern order matters
+EXTRA_TITLES = [
+    "QA Automation Engineer (SDET)",
+    "SDET (SDET in Test)",
+    "QA Automation Engineer [SDET]",
+    "Test & Reliability Engineer | Software Testing",
+    "Mobile Test Automation Engineer || W2 role",
+    "Senior SDET - Javascript",
+    "Software Test Engineer - Mid-Level - TGC",
+    "Vehicle-to-Cloud Integration and Automation Engineer",
+    "Software Test Engineer-Top Secret Cleared",
+    "Quality Engineer, 2+ Years of Experience",
+    "QA Lead, Experienced - Remote, 5 years",
+    "[a(b]c) Engineer",
+    "QA Engineer - Remote\n(Contract)",
+]
+EXTRA_COMPANY_NAMES = [
+    "Acme, Inc.",
+    "CEVIANS LLC",
+    "Amazon.com Services LLC",
+    "Acme™ Labs",
+    "Acme (US, Inc)",
+    "Insight Global (IG) Staffing",
+    "Incedo Inc.",
+    "Acme\nInc",
+]
+
+
+def legacy_clean(text: str, patterns: list[str], flags: int = 0):
+    """The per-call re.sub chain clean_job_title and clean_company_name used before"""
+    text = str(text).strip()
+    for pattern in patterns:
+        text = re.sub(pattern, "", text, flags=flags)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def load_corpus():
+    """Raw titles and company names from the saved LinkedIn pages in elements/"""
+    titles: list[str] = []
+    company_names: list[str] = []
+    for path in sorted(glob.glob("elements/*.html")):
+        with open(path, "r", encoding="utf-8") as html_file:
+            soup = BeautifulSoup(html_file.read(), "lxml")
+        titles += [e.get_text() for e in soup.select(".artdeco-entity-lockup__title strong")]
+        company_names += [e.get_text() for e in soup.select(".artdeco-entity-lockup__subtitle div")]
+    return titles + EXTRA_TITLES, company_names + EXTRA_COMPANY_NAMES
+
+
+def timed(label: str, run):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed * 1000:9.1f} ms  {BENCHMARK_SIZE / elapsed:12,.0f} /s")
+    return result
+
+
+def benchmark(name: str, corpus: list[str], patterns, flags, normalizer, clean_batch):
+    inputs = [corpus[i % len(corpus)] for i in range(BENCHMARK_SIZE)]
+    print(f"\n{name}: {BENCHMARK_SIZE} inputs, {len(set(corpus))} distinct")
+
+    expected = timed("legacy re.sub chain", lambda: [legacy_clean(t, patterns, flags) for t in inputs])
+
+    # Without the memo, every input goes through the merged patterns
+    uncached = normalizer._normalize  # pylint: disable=protected-access
+    actual = timed("merged patterns", lambda: [uncached(t.strip()) for t in inputs])
+    assert actual == expected, f"{name}: merged patterns differ from the legacy output"
+
+    normalizer.normalize.cache_clear()
+    actual = timed("batch API + LRU memo", lambda: clean_batch(inputs))
+    assert actual == expected, f"{name}: batch API differs from the legacy output"
+
+
+def main():
+    titles, company_names = load_corpus()
+    if not titles or not company_names:
+        sys.exit("No job cards found in elements/*.html")
+
+    benchmark("Job titles", titles, JOB_TITLE_PATTERNS, 0, JOB_TITLE_NORMALIZER, clean_job_titles)
+    benchmark(
+        "Company names",
+        company_names,
+        COMPANY_NAME_PATTERNS,
+        re.IGNORECASE,
+        COMPANY_NAME_NORMALIZER,
+        clean_company_names,
+    )
+
+
+if __name__ == "__main__":
+    # Run the benchmark with: python -m scripts.benchmarks.benchmark_normalization
+    main()
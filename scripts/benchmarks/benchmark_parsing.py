@@ -0,0 +1,60 @@
+# Standard imports
+import glob
+import os
+import time
+
+# Local imports
+from scripts.benchmarks.benchmark_scraping import build_cards, read_element
+from scripts.linkedin.parse_job_cards import PARSE_WORKERS, parse_jobs, parse_snapshots
+
+# Snapshots parsed per run, each a full results page of 25 cards
+SNAPSHOT_COUNT = int(os.getenv("BENCHMARK_SNAPSHOTS", "200"))
+
+
+def build_snapshot():
+    """A results page snapshot like page.content() after scrolling through all 25 cards"""
+    cards = "".join(card["html"] for card in build_cards(25))
+    return (
+        f'<html><body><ul class="scaffold-layout__list">{cards}</ul>'
+        f'{read_element("job_detail.html")}</body></html>'
+    )
+
+
+def timed(label: str, snapshot_count: int, card_count: int, run):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<28} {elapsed * 1000:9.1f} ms  {snapshot_count / elapsed:9.1f} snapshots/s"
+        f"  {card_count / elapsed:10.1f} cards/s"
+    )
+    return result
+
+
+def main():
+    # Every saved fixture must parse to the cards it contains, in both layouts
+    for path in sorted(glob.glob("elements/*.html")):
+        with open(path, "r", encoding="utf-8") as f:
+            print(f"{path}: {len(parse_jobs(f.read(), 'QA Engineer'))} cards")
+
+    snapshot = build_snapshot()
+    expected = parse_jobs(snapshot, "QA Engineer")
+    assert len(expected) == 25, f"Expected 25 cards, parsed {len(expected)}"
+
+    snapshots = [(snapshot, "QA Engineer")] * SNAPSHOT_COUNT
+    card_count = 25 * SNAPSHOT_COUNT
+    print(f"\n{SNAPSHOT_COUNT} snapshots of 25 cards ({len(snapshot) / 1024:.0f} KiB each)")
+
+    timed("one process", SNAPSHOT_COUNT, card_count, lambda: [parse_jobs(*s) for s in snapshots])
+    results = timed(
+        f"process pool ({PARSE_WORKERS or os.cpu_count()} workers)",
+        SNAPSHOT_COUNT,
+        card_count,
+        lambda: parse_snapshots(snapshots),
+    )
+    assert all(len(jobs) == 25 for jobs in results), "Process pool lost cards"
+
+
+if __name__ == "__main__":
+    # Run the benchmark with: python -m scripts.benchmarks.benchmark_parsing
+    main()
@@ -0,0 +1,306 @@
+# Standard imports
+import asyncio
+import contextlib
+import glob
+import io
+import json
+import os
+import re
+import time
+from typing import Any
+
+# Third party imports
+from playwright.async_api import BrowserContext, Page, Route, async_playwright
+
+# Local imports
+from scripts.linkedin.build_search_url import BASE_URL, build_search_url
+from scripts.linkedin.company_url_cache import get_company_key
+from scripts.linkedin.build_job import build_job
+from scripts.linkedin.crawl_state import CrawlState
+from scripts.linkedin.enrich_jobs import ENRICH_PAGES, JobEnricher
+from scripts.linkedin.extract_job_cards import extract_job_cards
+from scripts.linkedin.har_session import HAR_PATH, SNAPSHOT_DIR, replay_har
+from scripts.linkedin.stream_jobs import stream_linkedin_jobs
+from scripts.linkedin.wait_for_dom import wait_for_job_detail
+from utils.run_profiler import run_profiler
+
+# Cards on the synthetic results page, rendered CARDS_PER_SCROLL at a time like LinkedIn's lazy list
+CARD_COUNT = int(os.getenv("BENCHMARK_CARD_COUNT", "25"))
+CARDS_PER_SCROLL = 7
+
+# extract_job_cards calls per page
+EXTRACT_ITERATIONS = int(os.getenv("BENCHMARK_EXTRACT_ITERATIONS", "50"))
+
+# Sample cards and detail pane from elements/, with ids and names replaced per card
+TEMPLATE_JOB_ID = "4218098518"
+TEMPLATE_TITLE = "Quality Assurance Automation Engineer"
+TEMPLATE_COMPANY = "Capgemini"
+DETAIL_JOB_ID = "4200997323"
+DETAIL_COMPANY = "Insight Global"
+DETAIL_COMPANY_SLUG = "insight-global"
+
+TITLES = ["QA Engineer (Remote)", "Senior SDET - Payments", "Test Automation Engineer", "Quality Engineer, 3+ Years"]
+COMPANIES = ["Capgemini", "Talener", "Insight Global", "CEVIANS LLC", "Acme, Inc."]
+
+# Renders CARDS_PER_SCROLL more cards on each wheel event and fills the detail pane on click
+SYNTHETIC_PAGE_JS = """
+const cards = %(cards)s;
+const detail = %(detail)s;
+const list = document.querySelector("#results");
+let rendered = 0;
+const render = () => {
+  const next = Math.min(rendered + %(per_scroll)d, cards.length);
+  for (; rendered < next; rendered++) list.insertAdjacentHTML("beforeend", cards[rendered].html);
+};
+render();
+window.addEventListener("wheel", () => setTimeout(render, 50));
+document.addEventListener("click", (event) => {
+  const wrapper = event.target.closest("[data-job-id]");
+  if (!wrapper) return;
+  event.preventDefault();
+  const card = cards.find((c) => c.id === wrapper.getAttribute("data-job-id"));
+  setTimeout(() => {
+    document.querySelector("#detail").innerHTML = detail
+      .replaceAll("%(detail_id)s", card.id)
+      .replaceAll("%(detail_slug)s", card.slug)
+      .replaceAll("%(detail_company)s", card.company);
+    history.replaceState(null, "", `${location.pathname}${location.search}&currentJobId=${card.id}`);
+  }, 100);
+}, true);
+"""
+
+
+def read_element(name: str):
+    with open(os.path.join("elements", name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def build_cards(card_count: int = CARD_COUNT):
+    """Copies of the saved LinkedIn card with their own ids, titles and companies"""
+    template = read_element("job_card_20250529.html")
+    cards = []
+    for n in range(card_count):
+        job_id = str(4_300_000_000 + n)
+        company = COMPANIES[n % len(COMPANIES)]
+        html = (
+            template.replace(TEMPLATE_JOB_ID, job_id)
+            .replace(TEMPLATE_TITLE, TITLES[n % len(TITLES)])
+            .replace(TEMPLATE_COMPANY, company)
+        )
+        slug = re.sub(r"[^a-z0-9]+", "-", company.lower()).strip("-")
+        cards.append({"id": job_id, "company": company, "slug": slug, "html": html})
+    return cards
+
+
+def build_results_page(card_count: int = CARD_COUNT):
+    """A results page made of the saved LinkedIn card and detail pane markup"""
+    script = SYNTHETIC_PAGE_JS % {
+        "cards": json.dumps(build_cards(card_count)),
+        "detail": json.dumps(read_element("job_detail.html")),
+        "per_scroll": CARDS_PER_SCROLL,
+        "detail_id": DETAIL_JOB_ID,
+        "detail_slug": DETAIL_COMPANY_SLUG,
+        "detail_company": DETAIL_COMPANY,
+    }
+    return f'<html><body><ul id="results"></ul><div id="detail"></div><script>{script}</script></body></html>'
+
+
+async def serve_synthetic_results(context: BrowserContext, html: str):
+    """Local stand-in for LinkedIn: search URLs get the synthetic page, everything else is aborted"""
+
+    async def handle_route(route: Route):
+        if route.request.url.startswith(BASE_URL):
+            await route.fulfill(status=200, content_type="text/html", body=html)
+        else:
+            await route.abort()
+
+    await context.route("**/*", handle_route)
+
+
+def print_result(
+    label: str,
+    elapsed: float,
+    cards: int,
+    round_trips: int | None = None,
+    requests: int | None = None,
+):
+    line = f"{label:<40} {elapsed * 1000:9.1f} ms  {cards / elapsed:9.1f} cards/s"
+    if round_trips is not None:
+        line += f"  {round_trips:4d} round-trips"
+    if requests is not None:
+        line += f"  {requests:4d} requests"
+    print(line)
+
+
+async def benchmark_extraction(page: Page, label: str):
+    """Repeated extract_job_cards calls on an already rendered page"""
+    cards = await extract_job_cards(page)
+    start = time.perf_counter()
+    for _ in range(EXTRACT_ITERATIONS):
+        await extract_job_cards(page)
+    elapsed = time.perf_counter() - start
+    print_result(label, elapsed, len(cards) * EXTRACT_ITERATIONS, EXTRACT_ITERATIONS)
+
+
+async def benchmark_stream(page: Page, url: str, label: str, state: CrawlState):
+    """Full stream_linkedin_jobs run over one results page, scrolling and clicking like a real run"""
+    requests: list[str] = []
+    page.on("request", lambda request: requests.append(request.url))
+    run_profiler.durations.clear()
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        await page.goto(url)
+        jobs = [job async for job in stream_linkedin_jobs(page, "QA Engineer", state)]
+    elapsed = time.perf_counter() - start
+
+    # Calls into the browser are not observable from here, so only count the requests it made
+    print_result(label, elapsed, max(len(state.scanned_ids), 1), requests=len(requests))
+    print(f"  {len(jobs)} jobs, phases: " + ", ".join(
+        f"{name} x{len(durations)}" for name, durations in run_profiler.durations.items()
+    ))
+
+
+# Shows a detail pane and points the URL at another job, like LinkedIn right after a click
+SHOW_DETAIL_JS = """
+([detail, urlJobId]) => {
+  document.querySelector("#detail").innerHTML = detail;
+  history.replaceState(null, "", `${location.pathname}${location.search}&currentJobId=${urlJobId}`);
+}
+"""
+
+
+async def check_stale_detail_pane(page: Page, url: str):
+    """wait_for_job_detail must not resolve while only the URL names the clicked job"""
+    clicked_id = build_cards(1)[0]["id"]
+    detail = read_element("job_detail.html")
+    await page.goto(url)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        # The previous job's pane, with the clicked job already in the URL
+        await page.evaluate(SHOW_DETAIL_JS, [detail, clicked_id])
+        stale = await wait_for_job_detail(page, clicked_id, timeout_ms=500)
+        await page.evaluate(SHOW_DETAIL_JS, [detail.replace(DETAIL_JOB_ID, clicked_id), clicked_id])
+        loaded = await wait_for_job_detail(page, clicked_id, timeout_ms=500)
+
+    assert not stale, "wait_for_job_detail resolved on the previous job's pane"
+    assert loaded, "wait_for_job_detail missed the clicked job's pane"
+    print("wait_for_job_detail ignores a stale pane behind an updated URL")
+
+
+class CollectingWriter:
+    journal = None
+
+    def __init__(self):
+        self.jobs: list[dict[str, Any]] = []
+
+    def put(
+        self,
+        jobs: list[dict[str, Any]],
+        page_num: int = 0,
+        journal: bool = True,
+        query_key: str = "",
+    ):
+        self.jobs.extend(jobs)
+
+
+async def benchmark_enrichment(context: BrowserContext, page_count: int):
+    """JobEnricher over one page of new jobs, job pages served from serve_job_pages"""
+    writer = CollectingWriter()
+
+    async def get_context():
+        return context
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        async with JobEnricher(
+            get_context, writer, enabled=True, page_count=page_count, requests_per_second=0
+        ) as enricher:
+            enricher.put(
+                [
+                    build_job(card["id"], TITLES[0], card["company"], "", None, "QA Engineer")
+                    for card in build_cards()
+                ]
+            )
+    elapsed = time.perf_counter() - start
+    enriched = sum(1 for job in writer.jobs if job.get("hiring_team_names"))
+    described = sum(1 for job in writer.jobs if job.get("job_post_description"))
+    assert described == len(writer.jobs) - enricher.failed_count, "Enriched jobs lost their description"
+    label = f"enrich {len(writer.jobs)} jobs, {page_count} pages"
+    print_result(label, elapsed, len(writer.jobs), len(writer.jobs))
+    print(f"  {enriched} with hiring team, {enricher.failed_count} without details")
+
+
+async def serve_job_pages(context: BrowserContext):
+    """Local stand-in for /jobs/view/{id}: the saved detail pane, description and hiring team, after a short delay"""
+    sections = ["job_detail.html", "job_description.html", "meet_hiring_team.html"]
+    html = f"<html><body>{''.join(read_element(name) for name in sections)}</body></html>"
+
+    async def handle_route(route: Route):
+        if route.request.url.startswith("https://www.linkedin.com/jobs/view/"):
+            # Roughly a real job page's load time
+            await asyncio.sleep(0.2)
+            await route.fulfill(status=200, content_type="text/html", body=html)
+        else:
+            await route.abort()
+
+    await context.route("**/*", handle_route)
+
+
+async def main():
+    run_profiler.enabled = True
+    html = build_results_page()
+    url = build_search_url("QA Engineer")
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+
+        # Synthetic page, every company unknown so each first card of a company is clicked
+        context = await browser.new_context()
+        await serve_synthetic_results(context, html)
+        page = await context.new_page()
+        await check_stale_detail_pane(page, url)
+        await benchmark_stream(page, url, "stream, cold company cache", CrawlState())
+
+        # Same page with every company URL cached, so no card is clicked
+        company_urls = {
+            get_company_key(company): f"https://www.linkedin.com/company/{n}/"
+            for n, company in enumerate(COMPANIES + ["Acme", "CEVIANS"])
+        }
+        page = await context.new_page()
+        await benchmark_stream(
+            page, url, "stream, warm company cache", CrawlState(company_urls=company_urls)
+        )
+        await benchmark_extraction(page, f"extract_job_cards x{EXTRACT_ITERATIONS}")
+        await context.close()
+
+        # DOM snapshots saved by HAR_MODE=record, scripts removed
+        for path in sorted(glob.glob(os.path.join(SNAPSHOT_DIR, "*.html"))):
+            page = await browser.new_page()
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = re.sub(r"<script\b.*?</script>", "", f.read(), flags=re.DOTALL)
+            await page.set_content(snapshot)
+            await benchmark_extraction(page, f"snapshot {os.path.basename(path)}")
+            await page.close()
+
+        # A recorded session, served from the HAR file
+        if os.path.exists(HAR_PATH):
+            context = await browser.new_context()
+            await replay_har(context)
+            page = await context.new_page()
+            await benchmark_stream(page, url, "stream, HAR replay", CrawlState())
+            await context.close()
+
+        # New jobs opened one at a time, as clicking through the search page would, then in a pool
+        context = await browser.new_context()
+        await serve_job_pages(context)
+        for page_count in sorted({1, ENRICH_PAGES}):
+            await benchmark_enrichment(context, page_count)
+        await context.close()
+
+        await browser.close()
+
+
+if __name__ == "__main__":
+    # Run the benchmark with: python -m scripts.benchmarks.benchmark_scraping
+    asyncio.run(main())
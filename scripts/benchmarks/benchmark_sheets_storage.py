@@ -0,0 +1,138 @@
+# Standard imports
+import contextlib
+import io
+import logging
+import os
+import time
+import tracemalloc
+from typing import Any, Callable
+
+# Third party imports
+import requests
+
+# Local imports
+from scripts.google.fake_sheets_service import FakeSheetsService
+from scripts.google.job_id_index import JobIdIndex
+from scripts.google.read_from_sheets import read_from_sheets
+from scripts.google.write_to_sheets import write_to_sheets
+from scripts.storage.job_storage import JOB_COLUMNS
+
+# Rows already in the sheet for each run. Ex: BENCHMARK_SHEET_ROWS=1000,10000
+SHEET_ROWS = [int(n) for n in os.getenv("BENCHMARK_SHEET_ROWS", "1000,10000,100000").split(",")]
+
+# Jobs per append, like one JobWriter flush
+APPEND_SIZE = int(os.getenv("BENCHMARK_APPEND_SIZE", "50"))
+
+# Simulated round trip of one Sheets API request in seconds
+LATENCY = float(os.getenv("BENCHMARK_LATENCY", "0"))
+
+# Google Sheets allows at most 10 million cells per spreadsheet
+SHEETS_CELL_LIMIT = 10_000_000
+
+
+def make_job(n: int):
+    return {
+        "job_post_id": str(4_000_000_000 + n),
+        "job_post_title": "Senior Software Engineer in Test",
+        "job_post_url": f"https://www.linkedin.com/jobs/view/{4_000_000_000 + n}",
+        "job_post_location": "New York, NY (Hybrid)",
+        "company_name": "New York Technology Partners",
+        "company_linkedin_url": "https://www.linkedin.com/company/new-york-technology-partners/",
+        "job_search_keyword": "QA Engineer",
+        "job_post_source": "LinkedIn",
+        "created_at": "2025-05-29T12:00:00.000000",
+    }
+
+
+def make_service(row_count: int, **options: Any):
+    service = FakeSheetsService(latency=LATENCY, **options)
+    service.sheets["QA Engineer"] = [list(JOB_COLUMNS)] + [
+        [make_job(n)[column] for column in JOB_COLUMNS] for n in range(row_count)
+    ]
+    return service
+
+
+def measure(label: str, setup: Callable[[], tuple[FakeSheetsService, Callable[[], Any]]]):
+    """Print latency, transfer and peak memory of one call, each measured on a fresh setup"""
+    # Silence the functions' own progress prints
+    with contextlib.redirect_stdout(io.StringIO()):
+        service, run = setup()
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        sent, received = service.bytes_sent, service.bytes_received
+
+        # tracemalloc slows allocations down, so memory gets its own run
+        service, run = setup()
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(
+        f"{label:<34} {elapsed * 1000:9.1f} ms"
+        f"  sent {sent / 1024:9.1f} KiB"
+        f"  received {received / 1024:9.1f} KiB"
+        f"  peak {peak / 1024 / 1024:8.1f} MiB"
+    )
+
+
+def benchmark(row_count: int):
+    cells = (row_count + 1) * len(JOB_COLUMNS)
+    print(f"\n{row_count} rows ({cells / SHEETS_CELL_LIMIT:.1%} of the Sheets cell limit)")
+    new_jobs = [make_job(row_count + n) for n in range(APPEND_SIZE)]
+
+    def read_all():
+        service = make_service(row_count)
+        return service, lambda: read_from_sheets(service, "fake")
+
+    def load_index():
+        service = make_service(row_count)
+        return service, lambda: JobIdIndex.load(service, "fake", use_local_cache=False)
+
+    # Current path: the run's index answers dedup, so an append is one request
+    def append_with_index():
+        service = make_service(row_count)
+        index = JobIdIndex.load(service, "fake", use_local_cache=False)
+        service.bytes_received = 0
+        return service, lambda: write_to_sheets(service, "fake", new_jobs, index)
+
+    # Without an index every call reads column A first
+    def append_without_index():
+        service = make_service(row_count)
+        return service, lambda: write_to_sheets(service, "fake", new_jobs)
+
+    measure("read_from_sheets (A:N)", read_all)
+    measure("JobIdIndex.load (A:A)", load_index)
+    measure(f"write_to_sheets x{APPEND_SIZE} with index", append_with_index)
+    measure(f"write_to_sheets x{APPEND_SIZE} no index", append_without_index)
+
+
+def benchmark_errors(row_count: int = 1000, attempts: int = 200):
+    """How often appends fail when the API throttles, and how those failures surface"""
+    print(f"\n{attempts} appends with 5% 429 and 1% 500 errors")
+    service = make_service(row_count, error_rates={429: 0.05, 500: 0.01}, seed=1)
+    failures: dict[int, int] = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        index = JobIdIndex.load(service, "fake", use_local_cache=False)
+        for n in range(attempts):
+            try:
+                write_to_sheets(service, "fake", [make_job(row_count + n)], index)
+            except requests.exceptions.HTTPError as err:
+                status_code = err.response.status_code
+                failures[status_code] = failures.get(status_code, 0) + 1
+    print(f"Failed appends by status code: {failures}, rows in sheet: {len(index)}")
+
+
+def main():
+    # handle_exceptions logs every injected error, which is expected here
+    logging.disable(logging.ERROR)
+    print(f"Simulated latency: {LATENCY * 1000:.0f} ms per request")
+    for row_count in SHEET_ROWS:
+        benchmark(row_count)
+    benchmark_errors()
+
+
+if __name__ == "__main__":
+    # Run the benchmark with: python -m scripts.benchmarks.benchmark_sheets_storage
+    main()
@@ -0,0 +1,56 @@
+# Standard imports
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Local imports
+from scripts.benchmarks.benchmark_scraping import build_cards, read_element
+from scripts.linkedin.build_search_url import JOBS_PER_PAGE
+from scripts.linkedin.http_search import JOB_POSTING_FRAGMENT_PATH, SEARCH_FRAGMENT_PATH
+
+
+def build_handler(card_count: int, requests: list[str]):
+    cards = [card["html"] for card in build_cards(card_count)]
+    job_detail = read_element("job_detail.html").encode()
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        """LinkedIn's job fragments made of the elements/ markup, 25 cards per start offset"""
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            requests.append(self.path)
+            url = urlparse(self.path)
+            if url.path == SEARCH_FRAGMENT_PATH:
+                start = int(parse_qs(url.query).get("start", ["0"])[0])
+                body = "".join(f"<li>{card}</li>" for card in cards[start:start + JOBS_PER_PAGE])
+                self.respond(200, body.encode())
+            elif url.path.startswith(f"{JOB_POSTING_FRAGMENT_PATH}/"):
+                self.respond(200, job_detail)
+            else:
+                self.respond(404, b"")
+
+        def respond(self, status: int, body: bytes):
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+            pass
+
+    return FixtureHandler
+
+
+@contextmanager
+def serve_fixtures(card_count: int = 60):
+    """Local stand-in for LinkedIn's fragments. Ex: `with serve_fixtures() as (base_url, requests):`"""
+    requests: list[str] = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), build_handler(card_count, requests))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", requests
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,161 @@
+# Standard imports
+import asyncio
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+# Local imports
+from scripts.crawler.query_matrix import load_query_matrix
+from scripts.crawler.shard_worker import ShardJournal, ShardReport, run_worker
+from scripts.linkedin.company_url_cache import load_company_urls, save_company_urls
+from scripts.linkedin.crawl_watermark import save_watermark
+from scripts.slack.slack import slack
+from scripts.storage.get_job_storage import get_job_storage
+from scripts.storage.job_journal import JobJournal
+from scripts.storage.job_writer import JobWriter
+from utils.keyword_scheduler import record_keyword_run
+
+# Worker processes, each with its own browser. Defaults to one per core
+SHARD_WORKERS = int(os.getenv("SHARD_WORKERS", "0")) or os.cpu_count() or 1
+
+# How often the coordinator checks whether a worker died without saying goodbye
+RESULT_POLL_SECONDS = 1.0
+
+
+def format_shard_reports(reports: list[ShardReport], new_counts: dict[str, int]):
+    """Ex: QA Engineer|geo=101174742|f_T=any  default  w1  4 pages  100 cards  12 unique  3.1 cards/s"""
+    lines = ["Throughput per shard:"]
+    for report in sorted(reports, key=lambda report: report.key):
+        seconds = max(report.seconds, 1e-9)
+        status = f"  FAILED: {report.error}" if report.error else ""
+        lines.append(
+            f"{report.key:<60} {report.account:<10} w{report.worker_id:<2} {report.pages:>2} pages"
+            f" {report.cards_scanned:>4} cards {report.found:>4} found {new_counts[report.key]:>4} unique"
+            f" {report.seconds:>7.1f}s {report.cards_scanned / seconds:>6.2f} cards/s"
+            f" {new_counts[report.key] * 60 / seconds:>6.1f} unique/min{status}"
+        )
+    return "\n".join(lines)
+
+
+async def collect_results(
+    results: "queue.Queue[Any]", workers: list["asyncio.Future[None]"], writer: JobWriter
+):
+    """Merge every worker's jobs into one deduplicated stream to the writer, until all workers are done"""
+    seen_ids: set[str] = set()
+    new_counts: dict[str, int] = {}
+    duplicate_count = 0
+    reports: list[ShardReport] = []
+    company_urls: dict[str, str] = {}
+    done_count = 0
+
+    while done_count < len(workers):
+        try:
+            message = await asyncio.to_thread(results.get, True, RESULT_POLL_SECONDS)
+        except queue.Empty:
+            # A worker that crashed never sends "done", so stop once every process has exited
+            if all(worker.done() for worker in workers):
+                break
+            continue
+
+        kind, key, payload = message
+        if kind == "job":
+            job, page_num = payload
+            new_counts.setdefault(key, 0)
+            # The same posting shows up under overlapping regions and title filters
+            if job["job_post_id"] in seen_ids:
+                duplicate_count += 1
+                continue
+            seen_ids.add(job["job_post_id"])
+            new_counts[key] += 1
+            writer.put([job], page_num=page_num, query_key=key)
+        elif kind == "page":
+            # Cursor for a restarted crawl, journaled here since workers only read the journal
+            if writer.journal:
+                writer.journal.record_page(key, *payload)
+        elif kind == "shard":
+            new_counts.setdefault(key, 0)
+            reports.append(payload)
+        elif kind == "done":
+            company_urls.update(payload)
+            done_count += 1
+
+    print(f"Dropped {duplicate_count} jobs already scraped by another shard")
+    return reports, new_counts, company_urls
+
+
+async def main():
+    units = load_query_matrix()
+    worker_count = min(SHARD_WORKERS, len(units))
+    print(f"Scraping {len(units)} work units with {worker_count} worker processes")
+
+    storage = get_job_storage()
+    journal = JobJournal()
+    company_urls = load_company_urls()
+
+    # Spawn rather than fork, so no worker inherits the coordinator's threads or open handles
+    mp_context = multiprocessing.get_context("spawn")
+    with mp_context.Manager() as manager:
+        unit_queue = manager.Queue()
+        for unit in units:
+            unit_queue.put(unit)
+        results = manager.Queue()
+        accounts = {unit.account.name: unit.account for unit in units}
+        account_limits = {
+            name: manager.BoundedSemaphore(account.max_concurrency)
+            for name, account in accounts.items()
+        }
+        # Each unit resumes from the pages and jobs an interrupted crawl journaled for its key
+        journals = {unit.query.key: ShardJournal(results, journal, unit.query.key) for unit in units}
+
+        # Only the coordinator writes to the storage and the journal
+        async with JobWriter(storage, journal) as writer:
+            pending_jobs = journal.pending_jobs()
+            if pending_jobs:
+                print(f"Replaying {len(pending_jobs)} unstored jobs from the job journal")
+                writer.put(pending_jobs, journal=False)
+
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor(max_workers=worker_count, mp_context=mp_context) as pool:
+                workers = [
+                    loop.run_in_executor(
+                        pool, run_worker, worker_id, unit_queue, results, account_limits, journals
+                    )
+                    for worker_id in range(worker_count)
+                ]
+                reports, new_counts, worker_company_urls = await collect_results(
+                    results, workers, writer
+                )
+                worker_errors = await asyncio.gather(*workers, return_exceptions=True)
+
+    for report in reports:
+        if report.error:
+            continue
+        save_watermark(report.key, report.watermark_candidates)
+        record_keyword_run(report.key, new_counts[report.key], report.cards_scanned, report.seconds)
+
+    journal.compact(report.key for report in reports if not report.error)
+    journal.close()
+    company_urls.update(worker_company_urls)
+    save_company_urls(company_urls)
+    total_jobs = storage.count()
+    storage.close()
+
+    print(format_shard_reports(reports, new_counts))
+    failed = [report.key for report in reports if report.error]
+    slack(
+        f"Sharded job search over {len(units)} queries with {worker_count} workers:\n"
+        f"• New jobs added: {writer.new_jobs_count}\n"
+        f"• Failed queries: {len(failed) + len(units) - len(reports)}\n"
+        f"• Total jobs in database: {total_jobs}"
+    )
+
+    errors = [error for error in worker_errors if isinstance(error, BaseException)]
+    if errors:
+        raise errors[0]
+
+
+if __name__ == "__main__":
+    # Run the sharded crawler with: python -m scripts.crawler.coordinator
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+# Standard imports
+import json
+import os
+from dataclasses import dataclass
+from itertools import product
+
+# Local imports
+from scripts.linkedin.search_query import SearchQuery
+
+QUERY_MATRIX_PATH = os.getenv("QUERY_MATRIX", "query_matrix.json")
+
+# Split the work units across several runners: runner RUNNER_INDEX of RUNNER_COUNT takes every
+# RUNNER_COUNT-th unit. Ex: RUNNER_INDEX=1 RUNNER_COUNT=3 -> units 1, 4, 7, ...
+RUNNER_INDEX = int(os.getenv("RUNNER_INDEX", "0"))
+RUNNER_COUNT = int(os.getenv("RUNNER_COUNT", "1"))
+
+
+@dataclass(frozen=True)
+class Account:
+    name: str
+    # Environment variable holding the account's LinkedIn storage state
+    auth_env: str
+    # Work units scraped with this account at the same time, across every worker
+    max_concurrency: int
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    query: SearchQuery
+    account: Account
+
+
+def load_query_matrix(
+    path: str = QUERY_MATRIX_PATH,
+    runner_index: int = RUNNER_INDEX,
+    runner_count: int = RUNNER_COUNT,
+):
+    """Expand keywords x geo_ids x title_filters into this runner's work units.
+
+    Keywords default to keywords.json. Units are spread round-robin over the accounts, so
+    consecutive units of one keyword land on different accounts.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        matrix = json.load(f)
+
+    keywords: list[str] = matrix.get("keywords") or []
+    if not keywords:
+        with open("keywords.json", "r", encoding="utf-8") as keyword_file:
+            keywords = json.load(keyword_file)
+
+    accounts = [
+        Account(name, account["auth_env"], int(account.get("max_concurrency", 1)))
+        for name, account in matrix["accounts"].items()
+    ]
+    queries = [
+        SearchQuery(keyword, geo_id, tuple(title_ids))
+        for keyword, geo_id, title_ids in product(
+            keywords, matrix["geo_ids"].values(), matrix["title_filters"].values()
+        )
+    ]
+    units = [
+        WorkUnit(query, accounts[index % len(accounts)]) for index, query in enumerate(queries)
+    ]
+    return units[runner_index::runner_count]
@@ -0,0 +1,166 @@
+# pylint: disable=broad-exception-caught
+
+# Standard imports
+import asyncio
+import os
+import queue
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# Third party imports
+from playwright.async_api import Browser, BrowserContext, async_playwright
+
+# Local imports
+from scripts.crawler.query_matrix import Account, WorkUnit
+from scripts.linkedin.company_url_cache import load_company_urls
+from scripts.linkedin.create_context import create_context, load_storage_state
+from scripts.linkedin.crawl_state import CrawlState
+from scripts.linkedin.ensure_login import ensure_linkedin_login
+from scripts.linkedin.scrape_keyword import scrape_keyword
+from scripts.storage.get_job_storage import get_job_storage
+from scripts.storage.job_journal import JobJournal
+from scripts.storage.known_job_ids import KnownJobIds
+
+
+@dataclass
+class ShardReport:
+    """What one work unit did, sent to the coordinator when it finishes"""
+
+    key: str
+    account: str
+    worker_id: int
+    pages: int
+    cards_scanned: int
+    found: int
+    skipped: int
+    seconds: float
+    watermark_candidates: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+class ShardJournal:
+    """CursorJournal of a work unit, a snapshot of the coordinator's journal for its key.
+
+    Finished pages are sent back for the coordinator to record, since it is the only journal writer.
+    """
+
+    def __init__(self, results: "queue.Queue[Any]", journal: JobJournal, key: str):
+        self.results = results
+        self.finished_pages = journal.get_finished_pages(key)
+        self.page_counts = journal.get_finished_pages(key, include_guessed=False)
+        self.resumed_ids = journal.get_resumed_ids(key)
+
+    def get_finished_pages(self, keyword: str, include_guessed: bool = True):
+        return self.finished_pages if include_guessed else self.page_counts
+
+    def get_resumed_ids(self, keyword: str):
+        return self.resumed_ids
+
+    def record_job(self, job: dict[str, Any], page_num: int, query_key: str = ""):
+        """Nothing to do: the coordinator journals every job message it receives"""
+
+    def record_page(self, keyword: str, page_num: int, last_page_num: int, guessed: bool = False):
+        self.results.put(("page", keyword, (page_num, last_page_num, guessed)))
+
+
+class ShardWriter:
+    """JobSink of a worker process: every job goes to the coordinator, which dedups and stores it"""
+
+    def __init__(self, results: "queue.Queue[Any]", key: str, journal: ShardJournal | None = None):
+        self.results = results
+        self.key = key
+        self.journal = journal
+
+    def put(
+        self,
+        jobs: list[dict[str, Any]],
+        page_num: int = 0,
+        journal: bool = True,
+        query_key: str = "",
+    ):
+        for job in jobs:
+            self.results.put(("job", self.key, (job, page_num)))
+
+
+async def get_account_context(
+    browser: Browser, account: Account, contexts: dict[str, BrowserContext]
+):
+    """One logged-in context per account in this worker, created on its first unit"""
+    if account.name not in contexts:
+        context, _ = await create_context(browser, load_storage_state(account.auth_env), har=False)
+        page = await context.new_page()
+        await ensure_linkedin_login(page)
+        await page.close()
+        contexts[account.name] = context
+    return contexts[account.name]
+
+
+async def scrape_units(
+    worker_id: int,
+    units: "queue.Queue[WorkUnit]",
+    results: "queue.Queue[Any]",
+    account_limits: dict[str, Any],
+    journals: dict[str, ShardJournal],
+):
+    # Known ids are looked up in the storage from this process, the coordinator does the writing
+    shared = CrawlState(company_urls=load_company_urls(), seen_ids=KnownJobIds(get_job_storage()))
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=os.getenv("ENV", "").lower() != "local")
+        contexts: dict[str, BrowserContext] = {}
+        try:
+            while True:
+                try:
+                    unit = units.get_nowait()
+                except queue.Empty:
+                    break
+
+                # Shared across processes, so an account never has more than max_concurrency units in flight
+                limit = account_limits[unit.account.name]
+                await asyncio.to_thread(limit.acquire)
+                start = time.perf_counter()
+                state = CrawlState()
+                error = None
+                try:
+                    context = await get_account_context(browser, unit.account, contexts)
+                    writer = ShardWriter(results, unit.query.key, journals.get(unit.query.key))
+                    state = await scrape_keyword(context, unit.query, shared, writer)
+                except Exception as e:
+                    print(f"Worker {worker_id} failed on '{unit.query.key}': {e}")
+                    error = str(e)
+                finally:
+                    limit.release()
+
+                results.put(
+                    (
+                        "shard",
+                        unit.query.key,
+                        ShardReport(
+                            key=unit.query.key,
+                            account=unit.account.name,
+                            worker_id=worker_id,
+                            pages=state.page_count,
+                            cards_scanned=len(state.scanned_ids),
+                            found=state.found_count,
+                            skipped=state.skipped_count,
+                            seconds=time.perf_counter() - start,
+                            watermark_candidates=state.watermark_candidates,
+                            error=error,
+                        ),
+                    )
+                )
+        finally:
+            await browser.close()
+            results.put(("done", worker_id, shared.company_urls))
+
+
+def run_worker(
+    worker_id: int,
+    units: "queue.Queue[WorkUnit]",
+    results: "queue.Queue[Any]",
+    account_limits: dict[str, Any],
+    journals: dict[str, ShardJournal],
+):
+    """Worker process entry point: one browser, taking work units until the queue is empty"""
+    asyncio.run(scrape_units(worker_id, units, results, account_limits, journals))
@@ -0,0 +1,164 @@
+# Standard imports
+import json
+import random
+import time
+from typing import Any
+
+# Third party imports
+import requests
+
+# Status codes and reasons the fake can fail with. Ex: {429: 0.05} fails 5% of requests with 429
+ERROR_REASONS = {429: "Too Many Requests", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+def get_column_index(letters: str):
+    """Ex: A -> 0, I -> 8, AA -> 26"""
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index - 1
+
+
+class FakeRequest:
+    def __init__(self, service: "FakeSheetsService", run: Any, request_body: Any = None):
+        self.service = service
+        self.run = run
+        self.request_body = request_body
+
+    def execute(self):
+        return self.service.execute(self.run, self.request_body)
+
+
+class FakeValues:
+    def __init__(self, service: "FakeSheetsService"):
+        self.service = service
+
+    def get(self, spreadsheetId: str, range: str):  # pylint: disable=redefined-builtin
+        return FakeRequest(self.service, lambda: self.service.get_values(spreadsheetId, range))
+
+    def append(
+        self,
+        spreadsheetId: str,
+        range: str,  # pylint: disable=redefined-builtin
+        valueInputOption: str,  # pylint: disable=unused-argument
+        insertDataOption: str,  # pylint: disable=unused-argument
+        body: dict[str, Any],
+    ):
+        return FakeRequest(
+            self.service,
+            lambda: self.service.append_values(spreadsheetId, range, body["values"]),
+            body,
+        )
+
+    def update(
+        self,
+        spreadsheetId: str,
+        range: str,  # pylint: disable=redefined-builtin
+        valueInputOption: str,  # pylint: disable=unused-argument
+        body: dict[str, Any],
+    ):
+        return FakeRequest(
+            self.service,
+            lambda: self.service.update_values(spreadsheetId, range, body["values"]),
+            body,
+        )
+
+
+class FakeSpreadsheets:
+    def __init__(self, service: "FakeSheetsService"):
+        self.service = service
+
+    def values(self):
+        return FakeValues(self.service)
+
+
+class FakeSheetsService:
+    """In-process stand-in for build("sheets", "v4"), covering spreadsheets().values().get/append/update.
+
+    Each request waits `latency` seconds and may fail with the configured HTTP errors,
+    raised as requests.exceptions.HTTPError like handle_exceptions expects.
+    Bytes of JSON sent and received are counted to estimate transfer.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rates: dict[int, float] | None = None,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.error_rates = error_rates or {}
+        self.random = random.Random(seed)
+        # Sheet name -> rows. Ex: {"QA Engineer": [["job_post_id", ...], ["4226...", ...]]}
+        self.sheets: dict[str, list[list[str]]] = {}
+        self.request_count = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def spreadsheets(self):
+        return FakeSpreadsheets(self)
+
+    def execute(self, run: Any, request_body: Any = None):
+        self.request_count += 1
+        if request_body is not None:
+            self.bytes_sent += len(json.dumps(request_body))
+        if self.latency:
+            time.sleep(self.latency)
+
+        for status_code, rate in self.error_rates.items():
+            if self.random.random() < rate:
+                raise self.http_error(status_code)
+
+        result = run()
+        self.bytes_received += len(json.dumps(result))
+        return result
+
+    def http_error(self, status_code: int):
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = ERROR_REASONS.get(status_code, "Error")
+        response._content = json.dumps(  # pylint: disable=protected-access
+            {"error": {"code": status_code, "message": response.reason}}
+        ).encode()
+        return requests.exceptions.HTTPError(
+            f"{status_code} Client Error: {response.reason}", response=response
+        )
+
+    def get_values(self, spreadsheet_id: str, a1_range: str):
+        # Ex: "QA Engineer!A:I" -> rows of "QA Engineer", columns A to I
+        sheet_name, columns = a1_range.split("!")
+        first, last = columns.split(":")
+        start, stop = get_column_index(first), get_column_index(last) + 1
+
+        values: list[list[str]] = []
+        for row in self.sheets.get(sheet_name, []):
+            cells = row[start:stop]
+            # The API drops trailing empty cells
+            while cells and cells[-1] == "":
+                cells.pop()
+            values.append(cells)
+
+        result: dict[str, Any] = {"range": a1_range, "majorDimension": "ROWS"}
+        if values:
+            result["values"] = values
+        return result
+
+    def append_values(self, spreadsheet_id: str, a1_range: str, values: list[list[Any]]):
+        sheet_name = a1_range.split("!")[0]
+        rows = self.sheets.setdefault(sheet_name, [])
+        rows.extend([str(cell) for cell in row] for row in values)
+        return {
+            "spreadsheetId": spreadsheet_id,
+            "updates": {"updatedRange": a1_range, "updatedRows": len(values)},
+        }
+
+    def update_values(self, spreadsheet_id: str, a1_range: str, values: list[list[Any]]):
+        # Ex: "QA Engineer!A1:N1" -> rows from row 1, always starting at column A
+        sheet_name, cells = a1_range.split("!")
+        first_row = int("".join(char for char in cells.split(":")[0] if char.isdigit())) - 1
+        rows = self.sheets.setdefault(sheet_name, [])
+        for offset, row in enumerate(values):
+            while len(rows) <= first_row + offset:
+                rows.append([])
+            rows[first_row + offset] = [str(cell) for cell in row]
+        return {"spreadsheetId": spreadsheet_id, "updatedRange": a1_range, "updatedRows": len(values)}
@@ -4,26 +4,73 @@
 
 # Standard imports
 import base64
+import json
 import os
 import pickle
+import threading
+import time
+from functools import cache
 from typing import Any
 
 # Third party imports
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 
 # Local imports
 from scripts.google.create_oauth_json import create_oauth_json
 from utils.handle_exceptions import handle_exceptions
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+TOKEN_PATH = "token.pickle"
 
+# Seconds before a Sheets API request times out
+HTTP_TIMEOUT = int(os.getenv("SHEETS_HTTP_TIMEOUT", "60"))
 
-@handle_exceptions(raise_on_error=True)
-def get_google_sheets_service():
-    """Initialize Google Sheets API client using OAuth"""
+# One service handle per process, created on first use
+_service: "SheetsService | None" = None
+_service_lock = threading.Lock()
+
+
+@cache
+def load_discovery_document() -> dict[str, Any]:
+    """The Sheets v4 discovery document bundled with google-api-python-client, parsed once"""
+    return json.loads(get_static_doc("sheets", "v4"))
+
+
+class SheetsService:
+    """Drop-in for build("sheets", "v4") that can be shared across threads.
+
+    httplib2 connections are not thread-safe, so each thread lazily gets its own service
+    with its own keep-alive connection, all built from the same parsed discovery document and credentials.
+    """
+
+    def __init__(self, credentials: Credentials):
+        self.credentials = credentials
+        self._local = threading.local()
+
+    def get_service(self):
+        service = getattr(self._local, "service", None)
+        if service is None:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+            service = build_from_document(load_discovery_document(), http=http)
+            self._local.service = service
+        return service
+
+    def spreadsheets(self):
+        return self.get_service().spreadsheets()
+
+
+def save_credentials(creds: Credentials):
+    with open(TOKEN_PATH, "wb") as token:
+        pickle.dump(creds, token)
+
+
+def load_credentials():
     env = os.getenv("ENV", "")
     is_local = env.lower() == "local"
 
@@ -33,9 +80,6 @@ def get_google_sheets_service():
     token_pickle_base64 = os.getenv("GOOGLE_TOKEN_PICKLE")
     if not is_local and token_pickle_base64:
         try:
-            create_oauth_json()
-            print("Created google-oauth.json from environment variable")
-
             token_pickle = base64.b64decode(token_pickle_base64)
             creds = pickle.loads(token_pickle)
             print("Loaded token from GOOGLE_TOKEN_PICKLE environment variable")
@@ -44,31 +88,60 @@ def get_google_sheets_service():
             print(f"Failed to load token from environment: {e}")
 
     # For local development, use token.pickle file
-    elif is_local and os.path.exists("token.pickle"):
-        with open("token.pickle", "rb") as token:
+    elif is_local and os.path.exists(TOKEN_PATH):
+        with open(TOKEN_PATH, "rb") as token:
             creds = pickle.load(token)
-            print("Loaded token from token.pickle file")
-
-    # If token does not exist or is invalid, get new one
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            # This will only work in local environment
-            if is_local:
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    "google-oauth.json",
-                    SCOPES,
-                )
-                creds = flow.run_local_server(port=0)
-
-                # Save token locally
-                with open("token.pickle", "wb") as token:
-                    pickle.dump(creds, token)
-            else:
-                raise Exception(
-                    "Cannot authenticate with Google in GitHub Actions without GOOGLE_TOKEN_PICKLE"
-                )
-
-    service: Any = build("sheets", "v4", credentials=creds)
-    return service
+            print(f"Loaded token from {TOKEN_PATH} file")
+
+    if creds and creds.valid:
+        return creds
+
+    if creds and creds.expired and creds.refresh_token:
+        creds.refresh(Request())
+
+        # Save the refreshed token so the next local run reuses it until it expires.
+        # The GitHub Actions token comes from a secret and is never written to disk or the actions cache,
+        # where workflows of other branches could read it (and runs are further apart than its 1 hour lifetime).
+        if is_local:
+            save_credentials(creds)
+        return creds
+
+    # This will only work in local environment
+    if not is_local:
+        raise Exception(
+            "Cannot authenticate with Google in GitHub Actions without GOOGLE_TOKEN_PICKLE"
+        )
+
+    # Only the interactive flow needs the OAuth client file
+    if not os.path.exists("google-oauth.json"):
+        create_oauth_json()
+        print("Created google-oauth.json from environment variable")
+
+    flow = InstalledAppFlow.from_client_secrets_file("google-oauth.json", SCOPES)
+    creds = flow.run_local_server(port=0)
+
+    # Save token locally
+    save_credentials(creds)
+    return creds
+
+
+@handle_exceptions(raise_on_error=True)
+def get_google_sheets_service():
+    """Initialize Google Sheets API client using OAuth, once per process"""
+    global _service  # pylint: disable=global-statement
+
+    with _service_lock:
+        if _service is None:
+            start = time.perf_counter()
+            service = SheetsService(load_credentials())
+            credentials_ms = (time.perf_counter() - start) * 1000
+
+            # Build this thread's client now so startup cost shows up here
+            service.get_service()
+            total_ms = (time.perf_counter() - start) * 1000
+            print(
+                f"Built Google Sheets service in {total_ms:.0f} ms (credentials: {credentials_ms:.0f} ms)"
+            )
+            _service = service
+
+    return _service
@@ -0,0 +1,58 @@
+# Standard imports
+import os
+from typing import Any, Iterable
+
+# Local imports
+from scripts.google.read_job_ids import read_job_ids
+from utils.local_cache import load_cache, save_cache
+
+CACHE_NAME = "job_id_index.json"
+
+# Reuse the index saved by the previous run instead of reading column A again.
+# Only safe when this scraper is the only writer of the sheet.
+USE_LOCAL_CACHE = os.getenv("JOB_ID_INDEX_CACHE", "").lower() == "true"
+
+
+class JobIdIndex:
+    """Set of job_post_ids stored in the sheet, loaded once per run and updated on append"""
+
+    def __init__(self, spreadsheet_id: str, job_ids: Iterable[str], row_count: int):
+        self.spreadsheet_id = spreadsheet_id
+        self.job_ids: set[str] = set(job_ids)
+        # Rows in the sheet including the header, so writers know whether to add one
+        self.row_count = row_count
+
+    def __contains__(self, job_post_id: object):
+        return job_post_id in self.job_ids
+
+    def __len__(self):
+        return len(self.job_ids)
+
+    @classmethod
+    def load(cls, service: Any, spreadsheet_id: str, use_local_cache: bool = USE_LOCAL_CACHE):
+        if use_local_cache:
+            cached = load_cache(CACHE_NAME)
+            if cached and cached["spreadsheet_id"] == spreadsheet_id:
+                print(f"Loaded {len(cached['job_post_ids'])} job ids from local index")
+                return cls(spreadsheet_id, cached["job_post_ids"], cached["row_count"])
+
+        column_a = read_job_ids(service, spreadsheet_id)
+        job_ids = [job_id for job_id in column_a[1:] if job_id]
+        print(f"Loaded {len(job_ids)} job ids from the sheet")
+        return cls(spreadsheet_id, job_ids, len(column_a))
+
+    def add(self, job_ids: Iterable[str], header_added: bool = False):
+        """Record rows that were just appended to the sheet"""
+        job_ids = list(job_ids)
+        self.job_ids.update(job_ids)
+        self.row_count += len(job_ids) + (1 if header_added else 0)
+
+    def save(self):
+        save_cache(
+            CACHE_NAME,
+            {
+                "spreadsheet_id": self.spreadsheet_id,
+                "job_post_ids": sorted(self.job_ids),
+                "row_count": self.row_count,
+            },
+        )
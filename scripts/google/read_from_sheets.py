@@ -9,7 +9,7 @@ def read_from_sheets(service: Any, spreadsheet_id: str):
     result = (
         service.spreadsheets()
         .values()
-        .get(spreadsheetId=spreadsheet_id, range="QA Engineer!A:I")
+        .get(spreadsheetId=spreadsheet_id, range="QA Engineer!A:N")
         .execute()
     )
 
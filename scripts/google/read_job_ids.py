@@ -0,0 +1,17 @@
+from typing import Any
+
+from utils.handle_exceptions import handle_exceptions
+
+
+@handle_exceptions(raise_on_error=True)
+def read_job_ids(service: Any, spreadsheet_id: str):
+    """Read only column A (job_post_id), including the header row if there is one"""
+    result = (
+        service.spreadsheets()
+        .values()
+        .get(spreadsheetId=spreadsheet_id, range="QA Engineer!A:A")
+        .execute()
+    )
+
+    values: list[list[str]] = result.get("values", [])
+    return [row[0] if row else "" for row in values]
@@ -0,0 +1,39 @@
+from typing import Any
+
+from scripts.google.job_id_index import JobIdIndex
+from scripts.google.read_from_sheets import read_from_sheets
+from scripts.google.write_sheet_header import write_sheet_header
+from scripts.google.write_to_sheets import write_to_sheets
+
+
+class SheetsJobStorage:
+    """JobStorage backed by the "QA Engineer" sheet, with ids answered from a JobIdIndex"""
+
+    def __init__(self, service: Any, spreadsheet_id: str, index: JobIdIndex | None = None):
+        self.service = service
+        self.spreadsheet_id = spreadsheet_id
+        self.index = index or JobIdIndex.load(service, spreadsheet_id)
+        self._header_written = False
+
+    def exists(self, job_post_id: str):
+        return job_post_id in self.index
+
+    def append_batch(self, jobs: list[dict[str, Any]]) -> int:
+        # A sheet started before the detail columns has a header for A:I only, so rewrite it
+        # once per run before appending (idempotent, and cheaper than reading it first)
+        if self.index.row_count > 0 and not self._header_written:
+            write_sheet_header(self.service, self.spreadsheet_id)
+        self._header_written = True
+        return write_to_sheets(self.service, self.spreadsheet_id, jobs, self.index)
+
+    def count(self):
+        return len(self.index)
+
+    def iter_since(self, created_at: str):
+        # The Sheets API has no server-side filter, so this reads every row
+        for job in read_from_sheets(self.service, self.spreadsheet_id):
+            if job.get("created_at", "") >= created_at:
+                yield job
+
+    def close(self):
+        self.index.save()
@@ -0,0 +1,15 @@
+from typing import Any
+
+from scripts.storage.job_storage import STORED_COLUMNS
+from utils.handle_exceptions import handle_exceptions
+
+
+@handle_exceptions(raise_on_error=True)
+def write_sheet_header(service: Any, spreadsheet_id: str):
+    """Overwrite row 1 with every stored column, e.g. to add J:N to a sheet made with A:I"""
+    service.spreadsheets().values().update(
+        spreadsheetId=spreadsheet_id,
+        range="QA Engineer!A1:N1",
+        valueInputOption="RAW",
+        body={"values": [STORED_COLUMNS]},
+    ).execute()
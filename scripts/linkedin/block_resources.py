@@ -0,0 +1,79 @@
+# Standard imports
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+# Third party imports
+from playwright.async_api import BrowserContext, Response, Route
+
+# Opt-in because intercepting requests also disables Chromium's HTTP cache
+BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "").lower() == "true"
+
+# Company logos, profile photos (ivm-image-view-model), videos and fonts are never read
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "ping"}
+
+# Analytics and tracking hosts, matched as domain suffixes
+BLOCKED_HOSTS = (
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "ads.linkedin.com",
+    "snap.licdn.com",
+    "sb.scorecardresearch.com",
+)
+
+# LinkedIn's own tracking beacons on www.linkedin.com
+BLOCKED_PATH_PREFIXES = ("/li/track", "/li/tscp")
+
+
+@dataclass
+class ResourceBlockStats:
+    blocked: Counter[str] = field(default_factory=Counter)
+    allowed_requests: int = 0
+    # Sum of Content-Length of allowed responses. Aborted requests never download,
+    # so their size is unknown; compare this against a run without blocking instead.
+    allowed_bytes: int = 0
+
+    def summary(self):
+        blocked = ", ".join(f"{kind}: {count}" for kind, count in self.blocked.most_common())
+        return (
+            f"Blocked {sum(self.blocked.values())} requests ({blocked or 'none'}), "
+            f"allowed {self.allowed_requests} requests ({self.allowed_bytes / 1024:.0f} KiB)"
+        )
+
+
+def get_block_reason(resource_type: str, url: str):
+    """Return why a request should be aborted, or None to let it through"""
+    if resource_type in BLOCKED_RESOURCE_TYPES:
+        return resource_type
+
+    parsed = urlparse(url)
+    host = parsed.hostname or ""
+    if any(host == blocked or host.endswith(f".{blocked}") for blocked in BLOCKED_HOSTS):
+        return "analytics"
+    if host.endswith("linkedin.com") and parsed.path.startswith(BLOCKED_PATH_PREFIXES):
+        return "analytics"
+    return None
+
+
+async def block_resources(context: BrowserContext):
+    """Abort images, media, fonts and analytics for every page of the context; documents, XHR and scripts pass"""
+    stats = ResourceBlockStats()
+
+    async def handle_route(route: Route):
+        reason = get_block_reason(route.request.resource_type, route.request.url)
+        if reason:
+            stats.blocked[reason] += 1
+            await route.abort()
+        else:
+            # Fall back rather than continue so other handlers (e.g. HAR replay) still apply
+            await route.fallback()
+
+    def handle_response(response: Response):
+        stats.allowed_requests += 1
+        stats.allowed_bytes += int(response.headers.get("content-length", "0") or 0)
+
+    await context.route("**/*", handle_route)
+    context.on("response", handle_response)
+    return stats
@@ -0,0 +1,70 @@
+# Standard imports
+import asyncio
+import os
+from typing import Any
+
+# Third party imports
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+# Local imports
+from scripts.linkedin.block_resources import ResourceBlockStats
+from scripts.linkedin.create_context import create_context
+from scripts.linkedin.ensure_login import ensure_linkedin_login
+from scripts.linkedin.har_session import HAR_MODE, scrub_har
+from utils.run_profiler import run_profiler
+
+
+class BrowserSession:
+    """Chromium and one logged-in context, started on first use.
+
+    The HTTP engine only needs it to fall back, so a run it fully serves never launches a browser.
+    """
+
+    def __init__(self, storage_state: dict[str, Any] | None = None):
+        self.storage_state = storage_state
+        self.context: BrowserContext | None = None
+        self.block_stats: ResourceBlockStats | None = None
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_context(self):
+        async with self._lock:
+            if self.context is None:
+                self._playwright = await async_playwright().start()
+
+                # Always run headless in GitHub Actions
+                with run_profiler.phase("browser_launch"):
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=os.getenv("ENV", "").lower() != "local"
+                    )
+
+                # One authenticated context shared by every keyword's page
+                # HAR_MODE=record captures this run, HAR_MODE=replay serves a captured run back offline
+                with run_profiler.phase("context_creation"):
+                    context, self.block_stats = await create_context(
+                        self._browser, self.storage_state
+                    )
+                    page = await context.new_page()
+
+                # Loads /feed/ to check the session, and only logs in (and saves the new state) when
+                # the cookie is missing or LinkedIn no longer accepts it
+                # A replayed session has no cookies, and its recorded pages are already logged in
+                if HAR_MODE != "replay":
+                    with run_profiler.phase("ensure_login"):
+                        await ensure_linkedin_login(page)
+                await page.close()
+                self.context = context
+        return self.context
+
+    async def close(self):
+        if self.block_stats:
+            print(self.block_stats.summary())
+        if self.context and HAR_MODE == "record":
+            # The HAR file is only written when its context closes
+            await self.context.close()
+            scrub_har()
+        if self._browser:
+            await self._browser.close()
+        if self._playwright:
+            await self._playwright.stop()
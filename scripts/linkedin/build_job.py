@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from utils.clean_company_name import clean_company_name
+from utils.clean_job_title import clean_job_title
+
+
+def build_job(
+    job_post_id: str,
+    title: str,
+    company_name: str,
+    location: str,
+    company_linkedin_url: str | None,
+    keyword: str,
+):
+    """The job dict stored for each card, from its raw fields"""
+    return {
+        "job_post_id": job_post_id,
+        "job_post_title": clean_job_title(title).strip(),
+        "job_post_url": f"https://www.linkedin.com/jobs/view/{job_post_id}",
+        "job_post_location": location.strip(),
+        "company_name": clean_company_name(company_name).strip(),
+        "company_linkedin_url": company_linkedin_url,
+        "job_search_keyword": keyword,
+        "job_post_source": "LinkedIn",
+        "created_at": datetime.now().isoformat(),
+    }
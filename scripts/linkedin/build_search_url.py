@@ -0,0 +1,38 @@
+from urllib.parse import quote
+
+BASE_URL = "https://www.linkedin.com/jobs/search/"
+
+# LinkedIn shows 25 jobs per results page, and "start" is the offset of the first one
+JOBS_PER_PAGE = 25
+
+# Searched when no query matrix says otherwise: United States and the QA/test job titles
+DEFAULT_GEO_ID = "103644278"
+DEFAULT_TITLE_IDS = ("11227", "13936", "4729", "264", "661", "20648", "1510")
+
+
+def build_search_url(
+    keyword: str,
+    page_num: int = 1,
+    geo_id: str = DEFAULT_GEO_ID,
+    title_ids: tuple[str, ...] = DEFAULT_TITLE_IDS,
+):
+    # Encode keyword for URL
+    encoded_keyword = quote(keyword)
+
+    # Build the search URL with filters
+    filters = {
+        # Job titles filter, omitted when empty to search every title
+        "f_T": quote(",".join(title_ids)),
+        "geoId": geo_id,
+        "keywords": encoded_keyword,
+    }
+    if not title_ids:
+        del filters["f_T"]
+
+    # Ex: page 3 -> start=50
+    if page_num > 1:
+        filters["start"] = str((page_num - 1) * JOBS_PER_PAGE)
+
+    # Construct URL with parameters
+    url_params = "&".join([f"{k}={v}" for k, v in filters.items()])
+    return f"{BASE_URL}?{url_params}"
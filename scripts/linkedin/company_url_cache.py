@@ -0,0 +1,74 @@
+# pylint: disable=broad-exception-caught
+
+# Standard imports
+from typing import Any
+
+# Third party imports
+from playwright.async_api import Page, Response
+
+# Local imports
+from utils.clean_company_name import clean_company_name
+from utils.clean_company_url import clean_company_url
+from utils.local_cache import load_cache, save_cache
+
+CACHE_NAME = "company_urls.json"
+
+
+def get_company_key(company_name: str):
+    """Cache key for a cleaned company name, e.g. "Insight Global" -> "insight global" """
+    return company_name.strip().lower()
+
+
+def load_company_urls() -> dict[str, str]:
+    # Drop empty URLs saved by earlier runs, they would count as known companies forever
+    company_urls = {key: url for key, url in (load_cache(CACHE_NAME) or {}).items() if url}
+    print(f"Loaded {len(company_urls)} cached company URLs")
+    return company_urls
+
+
+def save_company_urls(company_urls: dict[str, str]):
+    save_cache(CACHE_NAME, company_urls)
+    print(f"Saved {len(company_urls)} company URLs to cache")
+
+
+def find_company_urls(data: Any, found: dict[str, str] | None = None):
+    """Collect {company key: company URL} from any {"name": ..., "url": ".../company/..."} object in a JSON document"""
+    found = {} if found is None else found
+    if isinstance(data, list):
+        for item in data:
+            find_company_urls(item, found)
+    elif isinstance(data, dict):
+        name = data.get("name")
+        url = data.get("url")
+        if (
+            isinstance(name, str)
+            and isinstance(url, str)
+            and "linkedin.com/company/" in url
+            and name.strip()
+        ):
+            company_url = clean_company_url(url)
+            # A URL that cleans to nothing is not cached, so the company is still looked up
+            if company_url:
+                found[get_company_key(clean_company_name(name))] = company_url
+        for value in data.values():
+            if isinstance(value, (dict, list)):
+                find_company_urls(value, found)
+    return found
+
+
+def listen_company_urls(page: Page, company_urls: dict[str, str]):
+    """Fill company_urls from the Voyager API responses the search page already loads, so cards need no click"""
+
+    async def handle_response(response: Response):
+        if "/voyager/api/" not in response.url:
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        try:
+            data = await response.json()
+            company_urls.update(find_company_urls(data))
+        except Exception:
+            # Bodies of redirects and aborted requests are not available
+            return
+
+    page.on("response", handle_response)
@@ -0,0 +1,75 @@
+# Standard imports
+import os
+from dataclasses import dataclass, field
+
+# Local imports
+from scripts.storage.known_job_ids import KnownJobIds
+from utils.run_profiler import run_profiler
+
+# Stop scanning once this many consecutive cards are already known (0 disables)
+STOP_AFTER_KNOWN = int(os.getenv("STOP_AFTER_KNOWN", "5"))
+
+
+@dataclass
+class CrawlState:
+    """State shared by search_linkedin_jobs calls for one keyword, across its result pages"""
+
+    # Company key -> company URL, shared with listen_company_urls and the persistent cache
+    company_urls: dict[str, str] = field(default_factory=dict)
+    # Job ids already stored or scraped earlier in this run (shared across keywords)
+    seen_ids: set[str] | KnownJobIds = field(default_factory=set)
+    # Newest job ids seen by the previous run for this keyword
+    watermark_ids: set[str] = field(default_factory=set)
+    # Job ids journaled by an interrupted run for this keyword, skipped without counting as known
+    resumed_ids: set[str] = field(default_factory=set)
+    stop_after_known: int = STOP_AFTER_KNOWN
+    # Every card id scanned in this run, in page order (newest first)
+    scanned_ids: list[str] = field(default_factory=list)
+    # Ids safe to remember in the watermark: known already, or handed to the writer.
+    # A card dropped mid-way (detail did not load, extraction error) must be retried next run.
+    watermark_candidates: list[str] = field(default_factory=list)
+    skipped_count: int = 0
+    # Jobs yielded for storage, pages loaded and wall time, for the scheduler and shard reports
+    found_count: int = 0
+    page_count: int = 0
+    elapsed_seconds: float = 0.0
+    reached_watermark: bool = False
+
+    def is_known(self, job_post_id: str):
+        return job_post_id in self.seen_ids or job_post_id in self.watermark_ids
+
+
+class PageScan:
+    """Which cards of one results page need no work, the same rules for the browser and HTTP engines"""
+
+    def __init__(self, state: CrawlState):
+        self.state = state
+        self.consecutive_known = 0
+
+    @property
+    def caught_up(self):
+        """Results are roughly newest first, so a run of known ids means we caught up"""
+        return 0 < self.state.stop_after_known <= self.consecutive_known
+
+    def skip(self, job_post_id: str):
+        """Count the card as scanned and return whether it is resumed or already known"""
+        state = self.state
+        state.scanned_ids.append(job_post_id)
+        run_profiler.count("cards_scanned")
+
+        # Already scraped by the interrupted run we are resuming
+        if job_post_id in state.resumed_ids:
+            state.watermark_candidates.append(job_post_id)
+            return True
+
+        # Skip known jobs before doing any per-card work
+        if state.is_known(job_post_id):
+            state.watermark_candidates.append(job_post_id)
+            state.skipped_count += 1
+            self.consecutive_known += 1
+            if self.caught_up:
+                state.reached_watermark = True
+            return True
+
+        self.consecutive_known = 0
+        return False
@@ -0,0 +1,36 @@
+# Standard imports
+from datetime import datetime
+
+# Local imports
+from utils.local_cache import load_cache, save_cache
+
+CACHE_NAME = "crawl_watermarks.json"
+
+# Number of newest job ids remembered per keyword
+MAX_WATERMARK_IDS = 200
+
+
+def load_watermark(keyword: str):
+    """Return the newest job ids seen by previous runs for this keyword"""
+    watermarks: dict[str, list[dict[str, str]]] = load_cache(CACHE_NAME) or {}
+    entries = watermarks.get(keyword, [])
+    if entries:
+        print(
+            f"Loaded watermark for '{keyword}': {len(entries)} ids, newest seen at {entries[0]['seen_at']}"
+        )
+    return {entry["job_post_id"] for entry in entries}
+
+
+def save_watermark(keyword: str, job_ids: list[str]):
+    """Prepend this run's known or stored ids (newest first) to the keyword's watermark"""
+    if not job_ids:
+        return
+
+    watermarks: dict[str, list[dict[str, str]]] = load_cache(CACHE_NAME) or {}
+    seen_at = datetime.now().isoformat()
+    entries = [{"job_post_id": job_id, "seen_at": seen_at} for job_id in job_ids]
+    remembered = set(job_ids)
+    entries += [e for e in watermarks.get(keyword, []) if e["job_post_id"] not in remembered]
+
+    watermarks[keyword] = entries[:MAX_WATERMARK_IDS]
+    save_cache(CACHE_NAME, watermarks)
@@ -0,0 +1,60 @@
+# pylint: disable=broad-exception-caught
+
+# Standard imports
+import json
+import os
+from typing import Any
+
+# Third party imports
+from playwright.async_api import Browser
+
+# Local imports
+from scripts.linkedin.block_resources import BLOCK_RESOURCES, ResourceBlockStats, block_resources
+from scripts.linkedin.har_session import HAR_MODE, get_har_context_options, replay_har
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"  # noqa: E501
+
+
+def load_storage_state(auth_env: str = "LINKEDIN_AUTH_JSON") -> dict[str, Any] | None:
+    """The account's saved LinkedIn session, or None to log in with LINKEDIN_USERNAME/PASSWORD"""
+    # For local development, use local auth file
+    if os.getenv("ENV", "").lower() == "local":
+        auth_file = os.path.join(os.path.expanduser("~"), "Downloads", "linkedin-auth.json")
+        if os.path.exists(auth_file):
+            print(f"Loading storage state from {auth_file}")
+            with open(auth_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return None
+
+    # For GitHub Actions, use the account's environment variable, LINKEDIN_AUTH_JSON by default
+    linkedin_auth_json = os.getenv(auth_env)
+    if linkedin_auth_json:
+        try:
+            storage_state = json.loads(linkedin_auth_json)
+            print(f"Loaded LinkedIn auth from {auth_env} environment variable")
+            return storage_state
+        except Exception as e:
+            print(f"Failed to parse {auth_env}: {e}")
+    return None
+
+
+async def create_context(
+    browser: Browser, storage_state: dict[str, Any] | None = None, har: bool = True
+):
+    """Browser context with our user agent and session, blocking resources if BLOCK_RESOURCES is set.
+
+    With har, HAR_MODE=record captures the context and HAR_MODE=replay serves a capture back.
+    Returns the context and its ResourceBlockStats (None when nothing is blocked).
+    """
+    options: dict[str, Any] = get_har_context_options() if har else {}
+    if storage_state:
+        options["storage_state"] = storage_state
+    context = await browser.new_context(user_agent=USER_AGENT, **options)
+
+    # Routes run last registered first, so blocking sees a request before the replay does
+    if har and HAR_MODE == "replay":
+        await replay_har(context)
+    block_stats: ResourceBlockStats | None = None
+    if BLOCK_RESOURCES:
+        block_stats = await block_resources(context)
+    return context, block_stats
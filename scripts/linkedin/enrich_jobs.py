@@ -0,0 +1,144 @@
+# pylint: disable=broad-exception-caught
+
+# Standard imports
+import asyncio
+import os
+from typing import Any, Awaitable, Callable
+
+# Third party imports
+from playwright.async_api import BrowserContext, Page
+
+# Local imports
+from scripts.linkedin.parse_job_detail import TOP_CARD_SELECTOR, parse_job_detail
+from scripts.linkedin.scrape_keyword import JobSink
+from utils.host_rate_limiter import HostRateLimiter
+from utils.run_profiler import run_profiler
+
+# Opt-in because every new job costs one more page load
+ENRICH_JOBS = os.getenv("ENRICH_JOBS", "").lower() == "true"
+
+# Job pages open at the same time, reused from job to job
+ENRICH_PAGES = int(os.getenv("ENRICH_PAGES", "3"))
+
+# Job page loads started per second per host, and attempts per job before storing it without details
+ENRICH_REQUESTS_PER_SECOND = float(os.getenv("ENRICH_REQUESTS_PER_SECOND", "1"))
+ENRICH_ATTEMPTS = int(os.getenv("ENRICH_ATTEMPTS", "3"))
+
+# The hiring team loads after the top card, and not every job has one
+HIRING_TEAM_SELECTOR = ".job-details-people-who-can-help__section--two-pane"
+HIRING_TEAM_WAIT_MS = 2000
+
+
+class JobEnricher:
+    """JobSink in front of the writer that adds JOB_DETAIL_COLUMNS from each job's page.
+
+    Use as `async with JobEnricher(get_context, writer) as sink:`. Only jobs handed to put are
+    opened, i.e. new ones after dedup, in a pool of ENRICH_PAGES reusable pages. Jobs are journaled
+    on put, so a crash mid-enrichment still stores them, without details, on the next run.
+    When disabled, put goes straight to the writer.
+    """
+
+    def __init__(
+        self,
+        get_context: Callable[[], Awaitable[BrowserContext]],
+        writer: JobSink,
+        enabled: bool = ENRICH_JOBS,
+        page_count: int = ENRICH_PAGES,
+        requests_per_second: float = ENRICH_REQUESTS_PER_SECOND,
+        attempts: int = ENRICH_ATTEMPTS,
+    ):
+        self.get_context = get_context
+        self.writer = writer
+        self.journal = writer.journal
+        self.enabled = enabled
+        self.page_count = page_count
+        self.attempts = attempts
+        self.rate_limiter = HostRateLimiter(requests_per_second)
+        self.enriched_count = 0
+        self.failed_count = 0
+        self._pages: "asyncio.Queue[Page]" = asyncio.Queue()
+        self._opened_pages: list[Page] = []
+        self._open_lock = asyncio.Lock()
+        self._tasks: set["asyncio.Task[None]"] = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        # Every job handed over reaches the writer, enriched or not, before the writer drains
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+        for page in self._opened_pages:
+            await page.close()
+        if self.enabled:
+            print(f"Enriched {self.enriched_count} jobs, {self.failed_count} stored without details")
+
+    def put(
+        self,
+        jobs: list[dict[str, Any]],
+        page_num: int = 0,
+        journal: bool = True,
+        query_key: str = "",
+    ):
+        if not self.enabled:
+            self.writer.put(jobs, page_num=page_num, journal=journal, query_key=query_key)
+            return
+
+        if self.journal and journal:
+            for job in jobs:
+                self.journal.record_job(job, page_num, query_key)
+        for job in jobs:
+            task = asyncio.create_task(self._enrich(job, page_num))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _acquire_page(self):
+        """A free page from the pool, opening one while fewer than page_count exist"""
+        async with self._open_lock:
+            if self._pages.empty() and len(self._opened_pages) < self.page_count:
+                page = await (await self.get_context()).new_page()
+                self._opened_pages.append(page)
+                return page
+        return await self._pages.get()
+
+    async def _load_detail(self, page: Page, url: str):
+        await self.rate_limiter.wait(url)
+        await page.goto(url)
+        await page.wait_for_selector(TOP_CARD_SELECTOR, timeout=15000)
+        try:
+            await page.wait_for_selector(HIRING_TEAM_SELECTOR, timeout=HIRING_TEAM_WAIT_MS)
+        except Exception:
+            pass
+        return parse_job_detail(await page.content())
+
+    async def _enrich(self, job: dict[str, Any], page_num: int):
+        url = f"https://www.linkedin.com/jobs/view/{job['job_post_id']}/"
+        detail: dict[str, str] = {}
+        try:
+            page = await self._acquire_page()
+        except Exception as e:
+            # No browser for details, the job itself still gets stored
+            print(f"Failed to open a page to enrich job {job['job_post_id']}: {e}")
+            self.failed_count += 1
+            self.writer.put([job], page_num=page_num, journal=False)
+            return
+
+        try:
+            for attempt in range(1, self.attempts + 1):
+                try:
+                    with run_profiler.phase("job_enrichment"):
+                        detail = await self._load_detail(page, url)
+                    self.enriched_count += 1
+                    break
+                except Exception as e:
+                    print(f"Failed to enrich job {job['job_post_id']} (attempt {attempt}): {e}")
+                    if attempt < self.attempts:
+                        # Ex: 1s, 2s, 4s
+                        await asyncio.sleep(2 ** (attempt - 1))
+            else:
+                self.failed_count += 1
+        finally:
+            self._pages.put_nowait(page)
+
+        # Already journaled on put
+        self.writer.put([{**job, **detail}], page_num=page_num, journal=False)
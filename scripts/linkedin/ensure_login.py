@@ -1,20 +1,46 @@
 # pylint: disable=broad-exception-caught
 
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+from scripts.linkedin.has_auth_cookie import has_auth_cookie
 from scripts.linkedin.login_with_linkedin import login_linkedin
 from scripts.linkedin.save_auth_state import save_auth_state
 from utils.handle_exceptions import handle_exceptions
 
+SIGN_IN_TEXT = "Sign in to view more jobs"
+
+# The "Me" menu in the global nav is only rendered for logged-in members
+LOGGED_IN_SELECTOR = ".global-nav__me"
+
+# Cheapest members-only page; a revoked session is redirected from it to one of LOGGED_OUT_PATHS
+FEED_URL = "https://www.linkedin.com/feed/"
+LOGGED_OUT_PATHS = ("/login", "/authwall", "/checkpoint", "/uas/")
+
+
+async def is_logged_in_page(page: Page):
+    """Race the logged-in nav against the sign-in popup and return as soon as either shows up"""
+    if any(path in page.url for path in LOGGED_OUT_PATHS):
+        return False
+    signin_popup = page.locator(f"text={SIGN_IN_TEXT}")
+    try:
+        await signin_popup.or_(page.locator(LOGGED_IN_SELECTOR)).first.wait_for(
+            timeout=5000
+        )
+    except PlaywrightTimeoutError:
+        # Neither showed up, assuming already logged in
+        return True
+    return not await signin_popup.is_visible()
+
 
 @handle_exceptions(raise_on_error=True)
 async def ensure_linkedin_login(page: Page):
-    try:
-        text = "Sign in to view more jobs"
-        signin_popup = await page.wait_for_selector(f"text={text}", timeout=5000)
-        if signin_popup is not None:
-            print("Not logged in, performing login...")
-            await login_linkedin(page)
-            await save_auth_state(page.context)
-    except Exception:
-        # No sign-in popup found, assuming already logged in
-        return
+    if await has_auth_cookie(page.context):
+        # The cookie can be revoked server-side, which only a loaded LinkedIn page shows,
+        # and callers pass a fresh about:blank page
+        if not page.url.startswith("https://www.linkedin.com"):
+            await page.goto(FEED_URL, wait_until="domcontentloaded")
+        if await is_logged_in_page(page):
+            return
+
+    print("Not logged in, performing login...")
+    await login_linkedin(page)
+    await save_auth_state(page.context)
@@ -0,0 +1,41 @@
+import asyncio
+import os
+from playwright.async_api import Page
+from scripts.linkedin.parse_job_cards import get_parse_pool, parse_job_cards
+from utils.handle_exceptions import handle_exceptions
+
+# "html" takes one page.content() snapshot per call and parses it in a worker process,
+# "browser" (default) reads the fields with one page.evaluate() call
+EXTRACT_MODE = os.getenv("EXTRACT_MODE", "browser").lower()
+
+JOB_CARD_SELECTOR = ".job-card-job-posting-card-wrapper"
+
+# Read every rendered card in one round-trip instead of ~6 locator calls per card
+# Selectors match elements/job_card_20250529.html
+EXTRACT_JOB_CARDS_JS = """
+(selector) => Array.from(document.querySelectorAll(selector)).map((card) => {
+  const text = (query) => {
+    const element = card.querySelector(query);
+    return element ? element.innerText : null;
+  };
+  return {
+    job_post_id: card.getAttribute("data-job-id"),
+    title: text(".artdeco-entity-lockup__title strong"),
+    company_name: text(".artdeco-entity-lockup__subtitle div"),
+    // Some cards have no location, which build_job stores as ""
+    location: text(".artdeco-entity-lockup__caption div") || "",
+    selector: `${selector}[data-job-id="${card.getAttribute("data-job-id")}"]`,
+  };
+})
+"""
+
+
+@handle_exceptions(raise_on_error=True)
+async def extract_job_cards(page: Page) -> list[dict[str, str | None]]:
+    """Return raw (uncleaned) fields of all job cards currently rendered on the page"""
+    if EXTRACT_MODE == "html":
+        html = await page.content()
+        return await asyncio.get_running_loop().run_in_executor(
+            get_parse_pool(), parse_job_cards, html
+        )
+    return await page.evaluate(EXTRACT_JOB_CARDS_JS, JOB_CARD_SELECTOR)
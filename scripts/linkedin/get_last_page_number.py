@@ -0,0 +1,22 @@
+from playwright.async_api import Page
+from scripts.linkedin.wait_for_dom import wait_for_pagination
+from utils.handle_exceptions import handle_exceptions
+
+# Every numbered pagination button except "…" carries data-test-pagination-page-btn,
+# so the largest one is the last page (see elements/page_numbers.html)
+LAST_PAGE_NUMBER_JS = """
+() => Math.max(
+  1,
+  ...Array.from(document.querySelectorAll("[data-test-pagination-page-btn]")).map(
+    (element) => Number(element.getAttribute("data-test-pagination-page-btn")) || 1
+  )
+)
+"""
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+async def get_last_page_number(page: Page) -> int | None:
+    """Largest page in the pagination, or None when it did not render in time"""
+    if not await wait_for_pagination(page):
+        return None
+    return await page.evaluate(LAST_PAGE_NUMBER_JS)
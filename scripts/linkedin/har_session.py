@@ -0,0 +1,78 @@
+# Standard imports
+import json
+import os
+import re
+
+# Third party imports
+from playwright.async_api import BrowserContext, Page
+
+# Local imports
+from utils.handle_exceptions import handle_exceptions
+
+# "record" saves LinkedIn traffic and DOM snapshots of a real run, "replay" serves them back
+HAR_MODE = os.getenv("HAR_MODE", "").lower()
+HAR_DIR = os.getenv("HAR_DIR", "recordings")
+HAR_PATH = os.path.join(HAR_DIR, "linkedin.har")
+SNAPSHOT_DIR = os.path.join(HAR_DIR, "snapshots")
+
+# Only LinkedIn pages and API calls; images and analytics are noise (and blocked by block_resources)
+HAR_URL_FILTER = re.compile(r"^https://www\.linkedin\.com/")
+
+# Removed from the recording so it holds no session: the li_at cookie alone logs anyone in
+SENSITIVE_HEADERS = {"cookie", "set-cookie", "csrf-token", "authorization"}
+
+
+def get_har_context_options(mode: str = HAR_MODE):
+    """Extra browser.new_context() options for record mode"""
+    if mode != "record":
+        return {}
+    os.makedirs(HAR_DIR, exist_ok=True)
+    return {
+        "record_har_path": HAR_PATH,
+        "record_har_url_filter": HAR_URL_FILTER,
+        "record_har_content": "embed",
+    }
+
+
+async def replay_har(context: BrowserContext, har_path: str = HAR_PATH):
+    """Serve LinkedIn requests from the recording; anything not recorded is aborted, never sent"""
+    if not os.path.exists(har_path):
+        raise FileNotFoundError(f"No recording at {har_path}, run with HAR_MODE=record first")
+    # No url filter: the recording only holds linkedin.com, and other hosts (static.licdn.com,
+    # media.licdn.com, trackers) must be aborted too rather than reach the live network
+    await context.route_from_har(har_path, not_found="abort")
+
+
+def get_snapshot_name(keyword: str, page_num: int):
+    """Ex: ("QA Engineer", 2) -> qa-engineer-page-2"""
+    return f"{re.sub(r'[^a-z0-9]+', '-', keyword.lower()).strip('-')}-page-{page_num}"
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+async def save_dom_snapshot(page: Page, name: str, mode: str = HAR_MODE):
+    """Save the rendered DOM next to the recording, like the hand-saved files in elements/"""
+    if mode != "record":
+        return
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    with open(os.path.join(SNAPSHOT_DIR, f"{name}.html"), "w", encoding="utf-8") as f:
+        f.write(await page.content())
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def scrub_har(har_path: str = HAR_PATH):
+    """Strip cookies and auth headers from a finished recording, in place"""
+    with open(har_path, "r", encoding="utf-8") as f:
+        har = json.load(f)
+
+    for entry in har["log"]["entries"]:
+        for message in (entry["request"], entry["response"]):
+            message["cookies"] = []
+            message["headers"] = [
+                header
+                for header in message["headers"]
+                if header["name"].lower() not in SENSITIVE_HEADERS
+            ]
+
+    with open(har_path, "w", encoding="utf-8") as f:
+        json.dump(har, f)
+    print(f"Saved {len(har['log']['entries'])} requests to {har_path} without cookies")
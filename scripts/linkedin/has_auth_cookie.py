@@ -0,0 +1,18 @@
+import time
+from playwright.async_api import BrowserContext
+
+# LinkedIn's session cookie, present only while logged in
+AUTH_COOKIE_NAME = "li_at"
+
+
+async def has_auth_cookie(context: BrowserContext):
+    """Check login state from the context's cookies, without loading any page"""
+    cookies = await context.cookies("https://www.linkedin.com")
+    now = time.time()
+    return any(
+        cookie.get("name") == AUTH_COOKIE_NAME
+        and cookie.get("value")
+        # -1 means a session cookie
+        and (cookie.get("expires", -1) == -1 or cookie.get("expires", -1) > now)
+        for cookie in cookies
+    )
@@ -0,0 +1,207 @@
+# Standard imports
+import asyncio
+import os
+import time
+from typing import Any
+from urllib.parse import quote
+
+# Third party imports
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Local imports
+from scripts.linkedin.build_job import build_job
+from scripts.linkedin.build_search_url import JOBS_PER_PAGE
+from scripts.linkedin.company_url_cache import get_company_key
+from scripts.linkedin.create_context import USER_AGENT
+from scripts.linkedin.crawl_state import CrawlState, PageScan
+from scripts.linkedin.crawl_watermark import load_watermark
+from scripts.linkedin.parse_job_cards import parse_company_url, parse_job_cards
+from scripts.linkedin.scrape_keyword import MAX_PAGES, JobSink
+from scripts.linkedin.search_query import SearchQuery
+from utils.clean_company_name import clean_company_name
+from utils.clean_company_url import clean_company_url
+from utils.run_profiler import run_profiler
+
+# "browser" drives Chromium through Playwright, "http" fetches result fragments without a browser
+# and falls back to Chromium for a keyword the fragments cannot serve
+FETCH_ENGINE = os.getenv("FETCH_ENGINE", "browser").lower()
+
+# Point at a stand-in server to run offline. Ex: http://127.0.0.1:8000
+HTTP_BASE_URL = os.getenv("LINKEDIN_HTTP_BASE_URL", "https://www.linkedin.com").rstrip("/")
+SEARCH_FRAGMENT_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+JOB_POSTING_FRAGMENT_PATH = "/jobs-guest/jobs/api/jobPosting"
+
+# Requests in flight per client, which is also the size of its connection pool
+HTTP_CONCURRENCY = int(os.getenv("HTTP_CONCURRENCY", "4"))
+HTTP_TIMEOUT_SECONDS = float(os.getenv("HTTP_TIMEOUT_SECONDS", "15"))
+
+
+class HttpFetchError(Exception):
+    """The HTTP engine cannot serve this request, e.g. rate limited or sent to the auth wall"""
+
+
+class HttpSearchClient:
+    """Pooled, cookie-carrying session for LinkedIn's job search fragments.
+
+    requests is blocking, so every request runs in a worker thread, HTTP_CONCURRENCY at a time.
+    """
+
+    def __init__(
+        self,
+        storage_state: dict[str, Any] | None = None,
+        base_url: str = HTTP_BASE_URL,
+        concurrency: int = HTTP_CONCURRENCY,
+    ):
+        self.base_url = base_url
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept": "text/html"})
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=concurrency,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=(500, 502, 503, 504),
+                # Hand the last response back so _get turns it into an HttpFetchError
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+        # Same session as the browser context, from LINKEDIN_AUTH_JSON or the local auth file
+        for cookie in (storage_state or {}).get("cookies", []):
+            self.session.cookies.set(
+                cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"]
+            )
+
+    def _get(self, path: str, params: str = ""):
+        url = f"{self.base_url}{path}{'?' + params if params else ''}"
+        try:
+            response = self.session.get(url, timeout=HTTP_TIMEOUT_SECONDS)
+        except requests.RequestException as e:
+            raise HttpFetchError(f"GET {url} failed: {e}") from e
+
+        # 999 and 429 are LinkedIn's bot and rate limits, the auth wall is a redirect
+        if response.status_code != 200 or "authwall" in response.url:
+            raise HttpFetchError(f"GET {url} -> {response.status_code} {response.url}")
+        return response.text
+
+    async def get(self, path: str, params: str = ""):
+        async with self._semaphore:
+            with run_profiler.phase("http_fetch"):
+                return await asyncio.to_thread(self._get, path, params)
+
+    async def fetch_results(self, query: SearchQuery, page_num: int = 1):
+        """HTML of up to 25 cards. Ex: page 3 -> start=50"""
+        params = {"keywords": quote(query.keyword), "geoId": query.geo_id}
+        if query.title_ids:
+            params["f_T"] = quote(",".join(query.title_ids))
+        params["start"] = str((page_num - 1) * JOBS_PER_PAGE)
+        return await self.get(SEARCH_FRAGMENT_PATH, "&".join(f"{k}={v}" for k, v in params.items()))
+
+    async def fetch_job_posting(self, job_post_id: str):
+        return await self.get(f"{JOB_POSTING_FRAGMENT_PATH}/{job_post_id}")
+
+    def close(self):
+        self.session.close()
+
+
+async def search_jobs_http(
+    client: HttpSearchClient, query: SearchQuery, state: CrawlState, page_num: int = 1
+):
+    """Same job dicts as stream_linkedin_jobs for one results page, and the number of cards on it"""
+    html = await client.fetch_results(query, page_num)
+    cards = parse_job_cards(html)
+    run_profiler.count("pages")
+    state.page_count += 1
+
+    jobs: list[dict[str, Any]] = []
+    scan = PageScan(state)
+    for card in cards:
+        job_post_id = card["job_post_id"]
+        if not (job_post_id and card["title"] and card["company_name"]):
+            continue
+
+        # Same skip rules and early stop as the browser
+        if scan.skip(job_post_id):
+            if scan.caught_up:
+                break
+            continue
+
+        # Logged-out cards link their company, logged-in ones need the job posting for it
+        company_key = get_company_key(clean_company_name(card["company_name"]))
+        company_linkedin_url = clean_company_url(card["company_url"]) or state.company_urls.get(
+            company_key
+        )
+        if company_linkedin_url is None:
+            with run_profiler.phase("card_detail"):
+                company_linkedin_url = parse_company_url(await client.fetch_job_posting(job_post_id))
+        if company_linkedin_url:
+            state.company_urls[company_key] = company_linkedin_url
+
+        jobs.append(
+            build_job(
+                job_post_id,
+                card["title"],
+                card["company_name"],
+                card["location"] or "",
+                company_linkedin_url,
+                query.keyword,
+            )
+        )
+        state.seen_ids.add(job_post_id)
+        run_profiler.count("jobs")
+
+    return jobs, len(cards)
+
+
+async def scrape_keyword_http(
+    client: HttpSearchClient, query: SearchQuery, shared: CrawlState, writer: JobSink
+):
+    """scrape_keyword without a browser: the same pages and state, fetched as HTML fragments"""
+    start = time.perf_counter()
+    journal = writer.journal
+    finished_pages = journal.get_finished_pages(query.key) if journal else {}
+    state = CrawlState(
+        company_urls=shared.company_urls,
+        seen_ids=shared.seen_ids,
+        watermark_ids=load_watermark(query.key),
+        resumed_ids=journal.get_resumed_ids(query.key) if journal else set(),
+    )
+
+    async def scrape_page(page_num: int):
+        print(f"\nFetching page {page_num} for keyword: {query.key} over HTTP")
+        jobs, card_count = await search_jobs_http(client, query, state, page_num)
+        writer.put(jobs, page_num=page_num, query_key=query.key)
+        state.watermark_candidates.extend(job["job_post_id"] for job in jobs)
+        state.found_count += len(jobs)
+        print(f"Found {len(jobs)} jobs on page {page_num} for keyword: {query.key}")
+
+        # Fragments have no pagination, a full page means there may be another one.
+        # Marked as a guess so a browser fallback does not take it as the page count.
+        last_page_num = page_num + 1 if card_count >= JOBS_PER_PAGE else page_num
+        if journal:
+            journal.record_page(query.key, page_num, last_page_num, guessed=True)
+        return last_page_num
+
+    # One page at a time, since only a full page says there is a next one.
+    # Keywords run concurrently and share the client's connection pool instead.
+    page_num = 1
+    last_page_num = 1
+    while page_num <= min(MAX_PAGES, last_page_num):
+        if page_num in finished_pages:
+            last_page_num = finished_pages[page_num]
+        else:
+            last_page_num = await scrape_page(page_num)
+        if state.reached_watermark:
+            print("Reached jobs seen on the last run, skipping remaining pages")
+            break
+        page_num += 1
+
+    print(f"Skipped {state.skipped_count} already known job cards for keyword: {query.key}")
+    state.elapsed_seconds = time.perf_counter() - start
+    return state
@@ -8,7 +8,9 @@ from utils.handle_exceptions import handle_exceptions
 @handle_exceptions(raise_on_error=True)
 async def login_linkedin(page: Page):
     await page.goto("https://www.linkedin.com/login")
-    await page.wait_for_load_state("networkidle")
+
+    # The form is usable as soon as the password input exists, no need to wait for networkidle
+    await page.wait_for_selector('input[id="password"]')
 
     # username is sometimes already set and doesn't exist
     try:
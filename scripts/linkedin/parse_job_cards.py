@@ -0,0 +1,161 @@
+# Standard imports
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urljoin
+
+# Third party imports
+from lxml import html as lxml_html
+
+# Local imports
+from scripts.linkedin.build_job import build_job
+from scripts.linkedin.company_url_cache import get_company_key
+from utils.clean_company_name import clean_company_name
+from utils.clean_company_url import clean_company_url
+from utils.handle_exceptions import handle_exceptions
+
+# Processes used by parse_snapshots and the shared pool, defaults to one per core
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", "0")) or None
+
+# Spawn rather than fork: the pool starts mid-run, and a fork would copy Playwright's threads
+# and sockets into every worker
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def has_class(name: str):
+    """XPath condition matching one class token. Ex: has_class("a") matches class="a b" but not "ab" """
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# job_card_20250529.html (job-card-job-posting-card-wrapper) and
+# job_card_20250501.html / job_cards.html (job-card-container)
+CARD_CLASSES = ["job-card-job-posting-card-wrapper", "job-card-container"]
+CARD_XPATH = f"//*[@data-job-id][{' or '.join(has_class(name) for name in CARD_CLASSES)}]"
+TITLE_XPATH = f".//*[{has_class('artdeco-entity-lockup__title')}]//strong"
+COMPANY_XPATH = f".//*[{has_class('artdeco-entity-lockup__subtitle')}]"
+# New layout: <div>New York, NY (On-site)</div>, old layout: <ul><li>Greater Syracuse-Auburn Area (On-site)</li>
+LOCATION_XPATH = f"(.//*[{has_class('artdeco-entity-lockup__caption')}]//*[self::div or self::li])[1]"
+
+# Logged-out fragment of /jobs-guest/jobs/api/seeMoreJobPostings/search, one <li> per card:
+# <div class="base-card ..." data-entity-urn="urn:li:jobPosting:4218098518">, with the company link
+GUEST_CARD_XPATH = f"//*[{has_class('base-card')}][@data-entity-urn]"
+GUEST_TITLE_XPATH = f".//*[{has_class('base-search-card__title')}]"
+GUEST_COMPANY_XPATH = f".//*[{has_class('base-search-card__subtitle')}]"
+GUEST_LOCATION_XPATH = f".//*[{has_class('job-search-card__location')}]"
+GUEST_COMPANY_LINK_XPATH = f".//*[{has_class('base-search-card__subtitle')}]//a/@href"
+
+# Company link in the detail pane (job_detail.html) or the logged-out job posting fragment
+COMPANY_URL_XPATH = (
+    f"//*[{has_class('job-details-jobs-unified-top-card__company-name')}]//a/@href"
+    f" | //a[{has_class('topcard__org-name-link')}]/@href"
+)
+
+
+def get_text(card: lxml_html.HtmlElement, xpath: str):
+    """Whitespace-collapsed text of the first match, like innerText, or None"""
+    elements = card.xpath(xpath)
+    if not elements:
+        return None
+    return " ".join(elements[0].text_content().split())
+
+
+@handle_exceptions(raise_on_error=True)
+def parse_job_cards(html: str) -> list[dict[str, str | None]]:
+    """Same raw card fields as extract_job_cards, from page HTML instead of the live DOM.
+
+    Logged-out cards also carry their company link as company_url, None for the other layouts.
+    Each card's selector matches it in the page whatever its layout, for clicking it.
+    """
+    tree = lxml_html.fromstring(html)
+    cards: list[dict[str, str | None]] = []
+    for card in tree.xpath(CARD_XPATH):
+        job_post_id = card.get("data-job-id")
+        layout = next(name for name in CARD_CLASSES if name in card.get("class", "").split())
+        cards.append(
+            {
+                "job_post_id": job_post_id,
+                "title": get_text(card, TITLE_XPATH),
+                "company_name": get_text(card, COMPANY_XPATH),
+                # Some cards have no location, which build_job stores as ""
+                "location": get_text(card, LOCATION_XPATH) or "",
+                "company_url": None,
+                "selector": f'.{layout}[data-job-id="{job_post_id}"]',
+            }
+        )
+    for card in tree.xpath(GUEST_CARD_XPATH):
+        company_links = card.xpath(GUEST_COMPANY_LINK_XPATH)
+        urn = card.get("data-entity-urn")
+        cards.append(
+            {
+                # Ex: urn:li:jobPosting:4218098518 -> 4218098518
+                "job_post_id": urn.rsplit(":", 1)[-1],
+                "title": get_text(card, GUEST_TITLE_XPATH),
+                "company_name": get_text(card, GUEST_COMPANY_XPATH),
+                "location": get_text(card, GUEST_LOCATION_XPATH) or "",
+                "company_url": company_links[0] if company_links else None,
+                "selector": f'.base-card[data-entity-urn="{urn}"]',
+            }
+        )
+    return cards
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def parse_company_url(html: str):
+    """Cleaned company URL from a job detail pane or job posting fragment, or None"""
+    hrefs = lxml_html.fromstring(html).xpath(COMPANY_URL_XPATH)
+    return clean_company_url(urljoin("https://www.linkedin.com", hrefs[0])) if hrefs else None
+
+
+@handle_exceptions(raise_on_error=True)
+def parse_jobs(html: str, keyword: str, company_urls: dict[str, str] | None = None):
+    """Job dicts like search_linkedin_jobs yields, for every complete card in the HTML.
+
+    Logged-in cards need the detail pane for their company URL, so it comes from
+    company_urls (None when unknown). Logged-out cards link their company themselves.
+    """
+    company_urls = company_urls or {}
+    jobs: list[dict[str, str | None]] = []
+    for card in parse_job_cards(html):
+        if not (card["job_post_id"] and card["title"] and card["company_name"]):
+            continue
+        company_key = get_company_key(clean_company_name(card["company_name"]))
+        jobs.append(
+            build_job(
+                card["job_post_id"],
+                card["title"],
+                card["company_name"],
+                card["location"] or "",
+                clean_company_url(card["company_url"]) or company_urls.get(company_key),
+                keyword,
+            )
+        )
+    return jobs
+
+
+def get_parse_pool():
+    """Process pool shared by every page of the run, started on first use"""
+    global _pool  # pylint: disable=global-statement
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=_MP_CONTEXT)
+    return _pool
+
+
+def _parse_snapshot(args: tuple[str, str, dict[str, str] | None]):
+    return parse_jobs(*args)
+
+
+def parse_snapshots(
+    snapshots: list[tuple[str, str]],
+    company_urls: dict[str, str] | None = None,
+    max_workers: int | None = PARSE_WORKERS,
+):
+    """Parse (html, keyword) snapshots across processes and return their job lists in order"""
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=_MP_CONTEXT) as pool:
+        return list(
+            pool.map(
+                _parse_snapshot,
+                [(html, keyword, company_urls) for html, keyword in snapshots],
+            )
+        )
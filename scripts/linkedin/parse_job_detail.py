@@ -0,0 +1,50 @@
+# Third party imports
+from lxml import html as lxml_html
+
+# Local imports
+from scripts.linkedin.parse_job_cards import get_text, has_class
+from utils.handle_exceptions import handle_exceptions
+
+# Shown once the detail pane or /jobs/view/{id} has rendered the job
+TOP_CARD_SELECTOR = ".job-details-jobs-unified-top-card__container--two-pane"
+
+DESCRIPTION_XPATH = f"//*[@id='job-details' or {has_class('jobs-description__content')}]"
+# Ex: United States · 8 hours ago · Over 100 applicants
+INSIGHTS_XPATH = f"//*[{has_class('job-details-jobs-unified-top-card__tertiary-description-container')}]"
+# Ex: $55/hr - $65/hr, Remote, Contract
+PILL_XPATH = f"//*[{has_class('job-details-preferences-and-skills__pill')}]"
+# One card per person in "Meet the hiring team" (meet_hiring_team.html)
+HIRER_XPATH = f"//*[{has_class('hirer-card__hirer-information')}]"
+HIRER_NAME_XPATH = f".//*[{has_class('jobs-poster__name')}]"
+
+
+@handle_exceptions(raise_on_error=True)
+def parse_job_detail(html: str) -> dict[str, str]:
+    """JOB_DETAIL_COLUMNS of a job page, empty strings for sections it does not have"""
+    tree = lxml_html.fromstring(html)
+
+    # The description keeps its line breaks, the other fields are one line like innerText
+    descriptions = tree.xpath(DESCRIPTION_XPATH)
+    description = ""
+    if descriptions:
+        lines = (" ".join(line.split()) for line in descriptions[0].text_content().splitlines())
+        description = "\n".join(line for line in lines if line)
+
+    # "0 of 3 skills match" is about the viewer's profile, not the job
+    pills = [" ".join(pill.text_content().split()) for pill in tree.xpath(PILL_XPATH)]
+    pills = [pill for pill in pills if pill and "skills match" not in pill]
+
+    names: list[str] = []
+    urls: list[str] = []
+    for hirer in tree.xpath(HIRER_XPATH):
+        names.append(get_text(hirer, HIRER_NAME_XPATH) or "")
+        hrefs = hirer.xpath(".//a/@href")
+        urls.append(hrefs[0].split("?")[0] if hrefs else "")
+
+    return {
+        "job_post_description": description,
+        "job_post_insights": get_text(tree, INSIGHTS_XPATH) or "",
+        "job_post_pills": " · ".join(pills),
+        "hiring_team_names": "; ".join(names),
+        "hiring_team_urls": "; ".join(urls),
+    }
@@ -0,0 +1,172 @@
+# Standard imports
+import asyncio
+import os
+import time
+from typing import Any, Protocol
+
+# Third party imports
+from playwright.async_api import BrowserContext, Page
+
+# Local imports
+from scripts.linkedin.company_url_cache import listen_company_urls
+from scripts.linkedin.crawl_state import CrawlState
+from scripts.linkedin.crawl_watermark import load_watermark
+from scripts.linkedin.get_last_page_number import get_last_page_number
+from scripts.linkedin.har_session import get_snapshot_name, save_dom_snapshot
+from scripts.linkedin.search_query import SearchQuery
+from scripts.linkedin.stream_jobs import stream_linkedin_jobs
+from scripts.linkedin.wait_for_dom import wait_for_active_page, wait_for_job_cards
+from utils.run_profiler import run_profiler
+
+# Result pages fetched per keyword, and how many of them are open in tabs at the same time
+MAX_PAGES = int(os.getenv("MAX_PAGES", "4"))
+PAGE_CONCURRENCY = int(os.getenv("PAGE_CONCURRENCY", "2"))
+
+
+class CursorJournal(Protocol):
+    """Where a query resumes from: a JobJournal in this process, or a ShardJournal of a worker"""
+
+    def record_job(self, job: dict[str, Any], page_num: int, query_key: str = "") -> None:
+        ...
+
+    def get_finished_pages(self, keyword: str, include_guessed: bool = True) -> dict[int, int]:
+        ...
+
+    def get_resumed_ids(self, keyword: str) -> set[str]:
+        ...
+
+    def record_page(
+        self, keyword: str, page_num: int, last_page_num: int, guessed: bool = False
+    ) -> None:
+        ...
+
+
+class JobSink(Protocol):
+    """Where scraped jobs go: a JobWriter in this process, or a ShardWriter to the coordinator"""
+
+    # Read-only, so writers may narrow it, e.g. JobWriter's JobJournal | None
+    @property
+    def journal(self) -> CursorJournal | None:
+        ...
+
+    def put(
+        self,
+        jobs: list[dict[str, Any]],
+        page_num: int = 0,
+        journal: bool = True,
+        query_key: str = "",
+    ) -> None:
+        ...
+
+
+async def scrape_results_page(
+    page: Page, query: SearchQuery, state: CrawlState, writer: JobSink, page_num: int
+):
+    """Hand each job to the writer as soon as it is extracted, so a failure mid-page keeps what we have"""
+    jobs_count = 0
+    async for job in stream_linkedin_jobs(page, query.keyword, state):
+        writer.put([job], page_num=page_num, query_key=query.key)
+        # Only now is the job safe from being lost, so only now may the watermark skip it
+        state.watermark_candidates.append(job["job_post_id"])
+        jobs_count += 1
+        state.found_count += 1
+    print(f"Found {jobs_count} jobs on page {page_num} for keyword: {query.key}")
+
+
+async def scrape_results_url(
+    context: BrowserContext,
+    query: SearchQuery,
+    state: CrawlState,
+    writer: JobSink,
+    page_num: int,
+):
+    """Open one results page by URL in its own tab and return the last available page number"""
+    page = await context.new_page()
+
+    # Pick up company URLs passively from the search page's API responses
+    listen_company_urls(page, state.company_urls)
+
+    try:
+        print(f"\nFetching page {page_num} for keyword: {query.key}")
+        with run_profiler.phase("page_navigation"):
+            await page.goto(query.url(page_num))
+            await page.wait_for_load_state("domcontentloaded")
+            if page_num > 1:
+                await wait_for_active_page(page, page_num)
+            await wait_for_job_cards(page)
+        run_profiler.count("pages")
+        state.page_count += 1
+
+        # A missed pagination must not cut the keyword to one page, so assume the most we fetch
+        last_page_num = await get_last_page_number(page)
+        if last_page_num is None:
+            print(
+                f"No pagination on page {page_num} for keyword: {query.key}, "
+                f"assuming {MAX_PAGES} pages"
+            )
+            last_page_num = MAX_PAGES
+        await scrape_results_page(page, query, state, writer, page_num)
+        await save_dom_snapshot(page, get_snapshot_name(query.key, page_num))
+
+        # Cursor for a restarted run: this page needs no scraping again
+        if writer.journal:
+            writer.journal.record_page(query.key, page_num, last_page_num)
+        return last_page_num
+
+    finally:
+        await page.close()
+
+
+async def scrape_keyword(
+    context: BrowserContext, query: SearchQuery, shared: CrawlState, writer: JobSink
+):
+    """Scrape one search query, sharing the run's company URLs and seen ids"""
+    start = time.perf_counter()
+
+    # Resume where an interrupted run for this query stopped
+    journal = writer.journal
+    finished_pages = journal.get_finished_pages(query.key) if journal else {}
+    # Page counts guessed by the HTTP engine, e.g. before it fell back to us, must not cap the pages
+    page_counts = journal.get_finished_pages(query.key, include_guessed=False) if journal else {}
+    state = CrawlState(
+        company_urls=shared.company_urls,
+        seen_ids=shared.seen_ids,
+        watermark_ids=load_watermark(query.key),
+        resumed_ids=journal.get_resumed_ids(query.key) if journal else set(),
+    )
+
+    # Page 1 also tells us how many pages there are
+    if 1 in page_counts:
+        print(f"Page 1 for keyword {query.key} was finished by the interrupted run")
+        last_page_num = page_counts[1]
+    else:
+        last_page_num = await scrape_results_url(context, query, state, writer, 1)
+    page_nums = [
+        page_num
+        for page_num in range(2, min(MAX_PAGES, last_page_num) + 1)
+        if page_num not in finished_pages
+    ]
+
+    if state.reached_watermark:
+        print("Reached jobs seen on the last run, skipping remaining pages")
+    elif page_nums:
+        # Fetch the remaining pages by URL in parallel tabs instead of clicking through them
+        semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+
+        async def run_page(page_num: int):
+            async with semaphore:
+                if state.reached_watermark:
+                    print(f"Reached jobs seen on the last run, skipping page {page_num}")
+                    return
+                await scrape_results_url(context, query, state, writer, page_num)
+
+        results = await asyncio.gather(
+            *(run_page(page_num) for page_num in page_nums), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            raise errors[0]
+
+    print(f"Skipped {state.skipped_count} already known job cards for keyword: {query.key}")
+    state.elapsed_seconds = time.perf_counter() - start
+    return state
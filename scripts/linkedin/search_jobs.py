@@ -1,98 +1,14 @@
-# pylint: disable=broad-exception-caught
-from datetime import datetime
 from playwright.async_api import Page
-from utils.clean_company_name import clean_company_name
-from utils.clean_job_title import clean_job_title
+from scripts.linkedin.crawl_state import CrawlState
+from scripts.linkedin.stream_jobs import stream_linkedin_jobs
 from utils.handle_exceptions import handle_exceptions
 
 
 @handle_exceptions(raise_on_error=True)
-async def search_linkedin_jobs(page: Page, keyword: str = "QA Engineer"):
-    results: list[dict[str, str | None]] = []
-    processed_ids: set[str] = set()
-    no_new_jobs_count = 0
-
-    # Scroll and collect jobs until we have at least 25 unique jobs
-    while len(results) < 25:
-        # Get current job cards: https://www.linkedin.com/jobs/search/?currentJobId=4220568275&f_T=11227%2C13936%2C4729%2C264%2C661%2C20648%2C1510&geoId=103644278&keywords=Test%20Automation%20Engineer&origin=JOB_SEARCH_PAGE_LOCATION_AUTOCOMPLETE
-        job_cards = await page.locator(".job-card-job-posting-card-wrapper").all()
-        initial_count = len(job_cards)
-
-        # Process new job cards
-        for card in job_cards:
-            try:
-                job_post_id = await card.get_attribute("data-job-id")
-
-                # Skip if we've already processed this job
-                if job_post_id is None or job_post_id in processed_ids:
-                    continue
-                processed_ids.add(job_post_id)
-
-                title = await card.locator(
-                    ".artdeco-entity-lockup__title strong"
-                ).inner_text()
-                title = clean_job_title(title)
-                company_name = await card.locator(
-                    ".artdeco-entity-lockup__subtitle div"
-                ).inner_text()
-                company_name = clean_company_name(company_name)
-                location = await card.locator(
-                    ".artdeco-entity-lockup__caption div"
-                ).first.inner_text()
-
-                # Click the card to load job details
-                await page.wait_for_timeout(1000)
-                await card.click()
-                await page.wait_for_selector(
-                    ".job-details-jobs-unified-top-card__company-name a"
-                )
-
-                company_linkedin_url = await page.locator(
-                    ".job-details-jobs-unified-top-card__company-name a"
-                ).get_attribute("href")
-                if company_linkedin_url:
-                    company_linkedin_url = company_linkedin_url.split("/life")[0] + "/"
-
-                results.append(
-                    {
-                        "job_post_id": job_post_id,
-                        "job_post_title": title.strip(),
-                        "job_post_url": f"https://www.linkedin.com/jobs/view/{job_post_id}",
-                        "job_post_location": location.strip(),
-                        "company_name": company_name.strip(),
-                        "company_linkedin_url": company_linkedin_url,
-                        "job_search_keyword": keyword,
-                        "job_post_source": "LinkedIn",
-                        "created_at": datetime.now().isoformat(),
-                    }
-                )
-
-            except Exception as e:
-                print(f"Error processing job card: {e}")
-                continue
-
-        print(f"Found {len(job_cards)} new job cards")
-        print(f"Found {len(results)} jobs so far\n")
-
-        if len(results) >= 25:
-            break
-
-        # Check if we found any new jobs in this iteration
-        if len(processed_ids) == initial_count:
-            no_new_jobs_count += 1
-            if no_new_jobs_count >= 3:  # If no new jobs found after 3 attempts, break
-                print("No new jobs found after multiple scroll attempts. Stopping.")
-                break
-        else:
-            no_new_jobs_count = 0
-
-        try:
-            # Smooth scroll to load more content
-            await page.mouse.wheel(0, 400)  # Increased scroll amount for efficiency
-            await page.wait_for_timeout(2000)  # Wait for new content to load
-
-        except Exception as e:
-            print(f"Error during scroll: {e}")
-            break
-
-    return results[:25]  # Return only first 25 jobs even if we found more
+async def search_linkedin_jobs(
+    page: Page,
+    keyword: str = "QA Engineer",
+    state: CrawlState | None = None,
+):
+    # The scan stops after the 25 cards of the page, so this is at most 25 jobs
+    return [job async for job in stream_linkedin_jobs(page, keyword, state)]
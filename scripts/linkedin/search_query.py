@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from scripts.linkedin.build_search_url import DEFAULT_GEO_ID, DEFAULT_TITLE_IDS, build_search_url
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """One search: a keyword in one region with one set of job title filters"""
+
+    keyword: str
+    geo_id: str = DEFAULT_GEO_ID
+    title_ids: tuple[str, ...] = DEFAULT_TITLE_IDS
+
+    @property
+    def key(self):
+        """Name for its watermark, journal cursor and stats.
+
+        Ex: "QA Engineer" with the default region and titles, so state saved before the query
+        matrix existed still applies, else "QA Engineer|geo=101174742|f_T=11227,13936"
+        """
+        if self.geo_id == DEFAULT_GEO_ID and self.title_ids == DEFAULT_TITLE_IDS:
+            return self.keyword
+        return f"{self.keyword}|geo={self.geo_id}|f_T={','.join(self.title_ids) or 'any'}"
+
+    def url(self, page_num: int = 1):
+        return build_search_url(self.keyword, page_num, self.geo_id, self.title_ids)
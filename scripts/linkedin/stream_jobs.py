@@ -0,0 +1,173 @@
+# pylint: disable=broad-exception-caught
+import asyncio
+import contextlib
+import os
+from typing import Any
+from playwright.async_api import Page
+from scripts.linkedin.build_job import build_job
+from scripts.linkedin.company_url_cache import get_company_key
+from scripts.linkedin.crawl_state import CrawlState, PageScan
+from scripts.linkedin.extract_job_cards import extract_job_cards
+from scripts.linkedin.wait_for_dom import wait_for_job_cards, wait_for_job_detail
+from utils.clean_company_name import clean_company_name
+from utils.clean_company_url import clean_company_url
+from utils.handle_exceptions import handle_exceptions
+from utils.run_profiler import run_profiler
+
+# How many extracted jobs may wait for the consumer before the scraper pauses
+QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "10"))
+
+_DONE = object()
+
+
+async def _scan_job_cards(
+    page: Page, keyword: str, state: CrawlState, queue: "asyncio.Queue[Any]"
+):
+    found_count = 0
+    processed_ids: set[str] = set()
+    scan = PageScan(state)
+    no_new_jobs_count = 0
+
+    # Scroll and scan cards until we have seen all 25 cards on the page
+    while len(processed_ids) < 25:
+        # Get current job cards: https://www.linkedin.com/jobs/search/?currentJobId=4220568275&f_T=11227%2C13936%2C4729%2C264%2C661%2C20648%2C1510&geoId=103644278&keywords=Test%20Automation%20Engineer&origin=JOB_SEARCH_PAGE_LOCATION_AUTOCOMPLETE
+        with run_profiler.phase("card_extraction"):
+            job_cards = await extract_job_cards(page)
+        initial_count = len(job_cards)
+
+        # Process new job cards
+        for card in job_cards:
+            try:
+                job_post_id = card["job_post_id"]
+                title = card["title"]
+                company_name = card["company_name"]
+                selector = card["selector"]
+
+                # A card still rendering lacks fields, the next scroll reads it again complete
+                if not (job_post_id and title and company_name and selector):
+                    continue
+
+                # Skip if we've already processed this job
+                if job_post_id in processed_ids:
+                    continue
+                if len(processed_ids) >= 25:
+                    break
+                processed_ids.add(job_post_id)
+
+                # Resumed and known jobs need no per-card work
+                if scan.skip(job_post_id):
+                    if scan.caught_up:
+                        break
+                    continue
+
+                # Only click the card for companies we have not seen yet
+                company_key = get_company_key(clean_company_name(company_name))
+                company_linkedin_url = state.company_urls.get(company_key)
+                if company_linkedin_url is None:
+                    with run_profiler.phase("card_detail"):
+                        # The card's own layout, which may not be JOB_CARD_SELECTOR's in html mode
+                        await page.locator(selector).click()
+                        detail_loaded = await wait_for_job_detail(page, job_post_id)
+                        href = None
+                        if detail_loaded:
+                            href = await page.locator(
+                                ".job-details-jobs-unified-top-card__company-name a"
+                            ).get_attribute("href")
+                    if not detail_loaded:
+                        print(f"Job detail for {job_post_id} did not load, skipping")
+                        continue
+
+                    company_linkedin_url = clean_company_url(href)
+                    if company_linkedin_url:
+                        state.company_urls[company_key] = company_linkedin_url
+
+                job = build_job(
+                    job_post_id,
+                    title,
+                    company_name,
+                    card["location"] or "",
+                    company_linkedin_url,
+                    keyword,
+                )
+                state.seen_ids.add(job_post_id)
+                found_count += 1
+                run_profiler.count("jobs")
+
+                # Blocks while the queue is full, so a slow consumer throttles scraping
+                await queue.put(job)
+
+            except Exception as e:
+                print(f"Error processing job card: {e}")
+                continue
+
+        print(f"Found {len(job_cards)} new job cards")
+        print(
+            f"Found {found_count} jobs so far, skipped {state.skipped_count} known jobs\n"
+        )
+
+        if scan.caught_up:
+            print(f"Reached {scan.consecutive_known} consecutive known jobs. Stopping.")
+            break
+
+        if len(processed_ids) >= 25:
+            break
+
+        # Check if we found any new jobs in this iteration
+        if len(processed_ids) == initial_count:
+            no_new_jobs_count += 1
+            if no_new_jobs_count >= 3:  # If no new jobs found after 3 attempts, break
+                print("No new jobs found after multiple scroll attempts. Stopping.")
+                break
+        else:
+            no_new_jobs_count = 0
+
+        try:
+            # Smooth scroll to load more content
+            with run_profiler.phase("scroll"):
+                await page.mouse.wheel(0, 400)  # Increased scroll amount for efficiency
+                await wait_for_job_cards(page, len(job_cards))  # Wait for new content to load
+
+        except Exception as e:
+            print(f"Error during scroll: {e}")
+            break
+
+
+@handle_exceptions(raise_on_error=True)
+async def stream_linkedin_jobs(
+    page: Page,
+    keyword: str = "QA Engineer",
+    state: CrawlState | None = None,
+    queue_size: int = QUEUE_SIZE,
+):
+    """Yield each cleaned job dict of the current results page as soon as it is extracted.
+
+    Jobs yielded before an error are kept by the consumer; the error is raised after them.
+    """
+    state = CrawlState() if state is None else state
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+
+    async def produce():
+        try:
+            await _scan_job_cards(page, keyword, state, queue)
+        finally:
+            # Never wait here, or a consumer that stopped early leaves us blocked on a full queue.
+            # If the queue is full, the consumer stops once it is drained and we are done.
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            if producer.done() and queue.empty():
+                break
+            job = await queue.get()
+            if job is _DONE:
+                break
+            yield job
+
+        # Re-raise anything the scraper failed with
+        await producer
+    finally:
+        # The consumer stopped early, e.g. on its own error
+        if not producer.done():
+            producer.cancel()
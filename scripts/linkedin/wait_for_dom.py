@@ -0,0 +1,107 @@
+# Standard imports
+import time
+from typing import Awaitable, Callable
+
+# Third party imports
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+# Local imports
+from scripts.linkedin.extract_job_cards import JOB_CARD_SELECTOR
+
+# Upper bounds for each wait. They are only reached when the DOM never changes,
+# e.g. scrolling past the last card, so they can be generous.
+CARD_WAIT_TIMEOUT_MS = 3000
+DETAIL_WAIT_TIMEOUT_MS = 10000
+PAGE_WAIT_TIMEOUT_MS = 10000
+# Pagination renders after the cards, and short searches have none, so this one stays short
+PAGINATION_WAIT_TIMEOUT_MS = 2000
+
+# Poll on a timer rather than requestAnimationFrame, which is throttled in background tabs
+POLLING_MS = 100
+
+# Every numbered pagination button except "…" carries it
+PAGINATION_BUTTON_SELECTOR = "[data-test-pagination-page-btn]"
+
+CARD_COUNT_GREW_JS = """
+([selector, previousCount]) => document.querySelectorAll(selector).length > previousCount
+"""
+
+# The company link alone is not enough because it is still the previous job's
+# while the pane re-renders, so also check that the pane points at the clicked job.
+# Not the URL: its currentJobId changes on click, before the pane does.
+JOB_DETAIL_LOADED_JS = """
+(jobId) => {
+  if (!document.querySelector(".job-details-jobs-unified-top-card__company-name a")) {
+    return false;
+  }
+  const title = document.querySelector(".job-details-jobs-unified-top-card__job-title a");
+  const applyButton = document.querySelector(".jobs-apply-button[data-job-id]");
+  return Boolean(
+    (title && (title.getAttribute("href") || "").includes(`/jobs/view/${jobId}/`)) ||
+      (applyButton && applyButton.getAttribute("data-job-id") === jobId)
+  );
+}
+"""
+
+
+async def _timed_wait(description: str, wait: Callable[[], Awaitable[object]]):
+    """Run a wait, print how long it took and return whether it resolved before its timeout"""
+    start = time.perf_counter()
+    try:
+        await wait()
+        resolved = True
+    except PlaywrightTimeoutError:
+        resolved = False
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    status = "resolved" if resolved else "timed out"
+    print(f"Wait for {description} {status} after {elapsed_ms:.0f} ms")
+    return resolved
+
+
+async def wait_for_job_cards(
+    page: Page, previous_count: int = 0, timeout_ms: float = CARD_WAIT_TIMEOUT_MS
+):
+    """Wait until more than previous_count job cards are rendered"""
+    return await _timed_wait(
+        f"more than {previous_count} job cards",
+        lambda: page.wait_for_function(
+            CARD_COUNT_GREW_JS,
+            arg=[JOB_CARD_SELECTOR, previous_count],
+            polling=POLLING_MS,
+            timeout=timeout_ms,
+        ),
+    )
+
+
+async def wait_for_job_detail(
+    page: Page, job_post_id: str, timeout_ms: float = DETAIL_WAIT_TIMEOUT_MS
+):
+    """Wait until the detail pane shows the job that was just clicked"""
+    return await _timed_wait(
+        f"job detail {job_post_id}",
+        lambda: page.wait_for_function(
+            JOB_DETAIL_LOADED_JS, arg=job_post_id, polling=POLLING_MS, timeout=timeout_ms
+        ),
+    )
+
+
+async def wait_for_active_page(
+    page: Page, page_num: int, timeout_ms: float = PAGE_WAIT_TIMEOUT_MS
+):
+    """Wait until the pagination marks page_num as the current page (see elements/page_numbers.html)"""
+    return await _timed_wait(
+        f"pagination page {page_num}",
+        lambda: page.wait_for_selector(
+            f'button[aria-current="true"][aria-label="Page {page_num}"]',
+            timeout=timeout_ms,
+        ),
+    )
+
+
+async def wait_for_pagination(page: Page, timeout_ms: float = PAGINATION_WAIT_TIMEOUT_MS):
+    """Wait until a numbered pagination button is rendered (see elements/page_numbers.html)"""
+    return await _timed_wait(
+        "pagination",
+        lambda: page.wait_for_selector(PAGINATION_BUTTON_SELECTOR, timeout=timeout_ms),
+    )
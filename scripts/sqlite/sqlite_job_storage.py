@@ -0,0 +1,124 @@
+# Standard imports
+import os
+import sqlite3
+import threading
+from typing import Any
+
+# Local imports
+from scripts.storage.job_storage import JOB_DETAIL_COLUMNS, STORED_COLUMNS
+from utils.local_cache import CACHE_DIR, REPLAY
+
+# A HAR replay always gets a scratch database inside its scratch cache dir
+SQLITE_PATH = os.path.join(CACHE_DIR, "jobs.sqlite3")
+if not REPLAY:
+    SQLITE_PATH = os.getenv("SQLITE_PATH", SQLITE_PATH)
+
+# Rows fetched at a time by iter_since
+FETCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_post_id TEXT PRIMARY KEY,
+    job_post_title TEXT NOT NULL,
+    job_post_url TEXT NOT NULL,
+    job_post_location TEXT,
+    company_name TEXT,
+    company_linkedin_url TEXT,
+    job_search_keyword TEXT,
+    job_post_source TEXT,
+    created_at TEXT NOT NULL,
+    job_post_description TEXT,
+    job_post_insights TEXT,
+    job_post_pills TEXT,
+    hiring_team_names TEXT,
+    hiring_team_urls TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company_name ON jobs (company_name);
+CREATE INDEX IF NOT EXISTS idx_jobs_job_search_keyword ON jobs (job_search_keyword);
+CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at);
+"""
+
+# Refresh what may change on LinkedIn, but keep when and for which keyword a job was first found,
+# and keep details already enriched when the same job comes back without them
+UPSERT_SQL = f"""
+INSERT INTO jobs ({", ".join(STORED_COLUMNS)}) VALUES ({", ".join("?" * len(STORED_COLUMNS))})
+ON CONFLICT (job_post_id) DO UPDATE SET
+    job_post_title = excluded.job_post_title,
+    job_post_url = excluded.job_post_url,
+    job_post_location = excluded.job_post_location,
+    company_name = excluded.company_name,
+    company_linkedin_url = excluded.company_linkedin_url,
+    {", ".join(f"{column} = COALESCE(NULLIF(excluded.{column}, ''), {column})" for column in JOB_DETAIL_COLUMNS)}
+"""
+
+
+class SqliteJobStorage:
+    """JobStorage in a local SQLite file. Lookups by id, company, keyword and date use indexes."""
+
+    def __init__(self, path: str = SQLITE_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Appends run in JobWriter's worker thread while lookups run on the event loop
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self.connection:
+            self.connection.executescript(SCHEMA)
+
+            # Databases created before the detail columns get them added, empty
+            existing = {row["name"] for row in self.connection.execute("PRAGMA table_info(jobs)")}
+            for column in JOB_DETAIL_COLUMNS:
+                if column not in existing:
+                    self.connection.execute(f"ALTER TABLE jobs ADD COLUMN {column} TEXT")
+
+    def exists(self, job_post_id: str):
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT 1 FROM jobs WHERE job_post_id = ?", (job_post_id,)
+            ).fetchone()
+        return row is not None
+
+    def append_batch(self, jobs: list[dict[str, Any]]) -> int:
+        # Dedup within the batch too (concurrent keywords can scrape the same job)
+        jobs = list({job["job_post_id"]: job for job in jobs}.values())
+        if not jobs:
+            return 0
+
+        # One transaction per batch, committed when the with block exits
+        with self._lock, self.connection:
+            existing_count = sum(
+                self.connection.execute(
+                    "SELECT 1 FROM jobs WHERE job_post_id = ?", (job["job_post_id"],)
+                ).fetchone()
+                is not None
+                for job in jobs
+            )
+            self.connection.executemany(
+                UPSERT_SQL, [[job.get(column) for column in STORED_COLUMNS] for job in jobs]
+            )
+        return len(jobs) - existing_count
+
+    def count(self) -> int:
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def iter_since(self, created_at: str):
+        with self._lock:
+            cursor = self.connection.execute(
+                f"SELECT {', '.join(STORED_COLUMNS)} FROM jobs WHERE created_at >= ? ORDER BY created_at",
+                (created_at,),
+            )
+
+        # Fetch in chunks so a full export does not load the whole table at once
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                return
+            for row in rows:
+                yield dict(row)
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
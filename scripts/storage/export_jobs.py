@@ -0,0 +1,52 @@
+# Standard imports
+from typing import Any
+
+# Local imports
+from scripts.sqlite.sqlite_job_storage import SqliteJobStorage
+from scripts.storage.get_job_storage import get_job_storage
+from scripts.storage.job_storage import JobStorage
+from utils.handle_exceptions import handle_exceptions
+from utils.local_cache import load_cache, save_cache
+
+CACHE_NAME = "sheets_export.json"
+
+# Jobs per append call to the target
+EXPORT_BATCH_SIZE = 500
+
+
+@handle_exceptions(raise_on_error=True)
+def export_jobs(source: JobStorage, target: JobStorage, created_at: str = ""):
+    """Copy jobs created at or after created_at from source to target and return the newest created_at"""
+    batch: list[dict[str, Any]] = []
+    exported_count = 0
+    latest = created_at
+
+    for job in source.iter_since(created_at):
+        batch.append(job)
+        latest = max(latest, job["created_at"])
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            exported_count += target.append_batch(batch)
+            batch = []
+    if batch:
+        exported_count += target.append_batch(batch)
+
+    print(f"Exported {exported_count} new jobs")
+    return latest
+
+
+def main():
+    # Jobs at the last exported timestamp are sent again, and skipped by the target as known
+    cached = load_cache(CACHE_NAME) or {}
+    source = SqliteJobStorage()
+    target = get_job_storage("sheets")
+    try:
+        latest = export_jobs(source, target, cached.get("exported_until", ""))
+        save_cache(CACHE_NAME, {"exported_until": latest})
+    finally:
+        source.close()
+        target.close()
+
+
+if __name__ == "__main__":
+    # Export the local SQLite store to Google Sheets with: python -m scripts.storage.export_jobs
+    main()
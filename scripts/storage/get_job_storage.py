@@ -0,0 +1,23 @@
+import os
+
+from scripts.google.get_google_sheets_service import get_google_sheets_service
+from scripts.google.sheets_job_storage import SheetsJobStorage
+from scripts.sqlite.sqlite_job_storage import SqliteJobStorage
+from scripts.storage.job_storage import STORAGE_BACKEND, JobStorage
+from utils.handle_exceptions import handle_exceptions
+
+
+@handle_exceptions(raise_on_error=True)
+def get_job_storage(backend: str = STORAGE_BACKEND) -> JobStorage:
+    if backend == "sqlite":
+        return SqliteJobStorage()
+
+    if backend != "sheets":
+        raise ValueError(f"Unknown STORAGE_BACKEND: {backend}")
+
+    # Use SPREADSHEET_ID from environment if available, otherwise fail
+    spreadsheet_id = os.getenv("SPREADSHEET_ID")
+    if not spreadsheet_id:
+        raise ValueError("SPREADSHEET_ID environment variable is required")
+
+    return SheetsJobStorage(get_google_sheets_service(), spreadsheet_id)
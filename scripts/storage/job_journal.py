@@ -0,0 +1,141 @@
+# Standard imports
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+# Local imports
+from utils.local_cache import get_cache_path
+
+JOURNAL_NAME = "job_journal.jsonl"
+
+# Search results change, so a cursor older than this is not resumed
+CURSOR_MAX_AGE_HOURS = float(os.getenv("JOURNAL_CURSOR_MAX_AGE_HOURS", "24"))
+
+
+class JobJournal:
+    """Append-only JSONL log of scraped jobs, finished pages and stored jobs, fsync'd per entry.
+
+    Entries:
+    - {"type": "job", "keyword": "QA Engineer", "page_num": 2, "job": {...}}: a scraped job of a
+      query key, also the cursor within its page
+    - {"type": "page", "keyword": "QA Engineer", "page_num": 2, "last_page_num": 4}: a finished page,
+      "guessed": true when last_page_num is the HTTP engine's guess, not the pagination's
+    - {"type": "stored", "job_post_ids": [...]}: jobs the storage accepted
+
+    Replaying it after a crash gives the jobs still to store and the pages not to scrape again.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path or get_cache_path(JOURNAL_NAME)
+        self.entries: list[dict[str, Any]] = []
+        self.stored_ids: set[str] = set()
+        self._replay()
+        self._file = open(self.path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # The last line is torn when the process died mid-write
+                    continue
+                self.entries.append(entry)
+                if entry["type"] == "stored":
+                    self.stored_ids.update(entry["job_post_ids"])
+
+    def _append(self, entry: dict[str, Any]):
+        entry["at"] = datetime.now().isoformat()
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.entries.append(entry)
+
+    def record_job(self, job: dict[str, Any], page_num: int, query_key: str = ""):
+        keyword = query_key or job["job_search_keyword"]
+        self._append({"type": "job", "keyword": keyword, "page_num": page_num, "job": job})
+
+    def record_page(self, keyword: str, page_num: int, last_page_num: int, guessed: bool = False):
+        entry = {
+            "type": "page",
+            "keyword": keyword,
+            "page_num": page_num,
+            "last_page_num": last_page_num,
+        }
+        if guessed:
+            entry["guessed"] = True
+        self._append(entry)
+
+    def record_stored(self, job_post_ids: Iterable[str]):
+        job_post_ids = list(job_post_ids)
+        self._append({"type": "stored", "job_post_ids": job_post_ids})
+        self.stored_ids.update(job_post_ids)
+
+    def pending_jobs(self):
+        """Jobs scraped but not stored yet, e.g. by a run that died before flushing them"""
+        jobs = {
+            entry["job"]["job_post_id"]: entry["job"]
+            for entry in self.entries
+            if entry["type"] == "job" and entry["job"]["job_post_id"] not in self.stored_ids
+        }
+        return list(jobs.values())
+
+    def _is_fresh(self, entry: dict[str, Any]):
+        age = datetime.now() - datetime.fromisoformat(entry["at"])
+        return age < timedelta(hours=CURSOR_MAX_AGE_HOURS)
+
+    def get_resumed_ids(self, keyword: str):
+        """Ids already scraped for a query key by a recent run, stored or not"""
+        return {
+            entry["job"]["job_post_id"]
+            for entry in self.entries
+            if entry["type"] == "job"
+            # Entries written before query keys only have the job's keyword
+            and entry.get("keyword", entry["job"]["job_search_keyword"]) == keyword
+            and self._is_fresh(entry)
+        }
+
+    def get_finished_pages(self, keyword: str, include_guessed: bool = True):
+        """Ex: {1: 4, 2: 4} -> pages 1 and 2 are done, and page 1 said there are 4 pages"""
+        return {
+            entry["page_num"]: entry["last_page_num"]
+            for entry in self.entries
+            if entry["type"] == "page"
+            and entry["keyword"] == keyword
+            and self._is_fresh(entry)
+            and (include_guessed or not entry.get("guessed"))
+        }
+
+    def compact(self, finished_keywords: Iterable[str]):
+        """Rewrite the journal without what is done: stored jobs and the cursors of finished keywords"""
+        finished_keywords = set(finished_keywords)
+        kept = [
+            entry
+            for entry in self.entries
+            if (entry["type"] == "job" and entry["job"]["job_post_id"] not in self.stored_ids)
+            or (
+                entry["type"] == "page"
+                and entry["keyword"] not in finished_keywords
+                and self._is_fresh(entry)
+            )
+        ]
+
+        # Same temp file and os.replace as save_cache, so a crash leaves the old journal intact
+        self._file.close()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in kept)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        self.entries = kept
+        self.stored_ids = set()
+        self._file = open(self.path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        print(f"Compacted job journal to {len(kept)} entries")
+
+    def close(self):
+        self._file.close()
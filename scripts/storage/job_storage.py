@@ -0,0 +1,55 @@
+# Standard imports
+import os
+from typing import Any, Iterator, Protocol
+
+# Local imports
+from utils.local_cache import REPLAY
+
+# "sheets" (default) or "sqlite". A HAR replay never writes to the sheet, so it is always "sqlite".
+STORAGE_BACKEND = "sqlite" if REPLAY else os.getenv("STORAGE_BACKEND", "sheets").lower()
+
+# Fields of a scraped job, in sheet column order (A:I)
+JOB_COLUMNS = [
+    "job_post_id",
+    "job_post_title",
+    "job_post_url",
+    "job_post_location",
+    "company_name",
+    "company_linkedin_url",
+    "job_search_keyword",
+    "job_post_source",
+    "created_at",
+]
+
+# Filled in by the enrichment stage from the job page (J:N), empty for jobs it has not enriched
+JOB_DETAIL_COLUMNS = [
+    "job_post_description",
+    "job_post_insights",
+    "job_post_pills",
+    "hiring_team_names",
+    "hiring_team_urls",
+]
+
+# Every stored column, in sheet column order (A:N)
+STORED_COLUMNS = JOB_COLUMNS + JOB_DETAIL_COLUMNS
+
+
+class JobStorage(Protocol):
+    """Where scraped jobs are stored. Only the operations the pipeline needs."""
+
+    def exists(self, job_post_id: str) -> bool:
+        ...
+
+    def append_batch(self, jobs: list[dict[str, Any]]) -> int:
+        """Store jobs not stored yet and return how many were new"""
+        ...
+
+    def count(self) -> int:
+        ...
+
+    def iter_since(self, created_at: str) -> Iterator[dict[str, Any]]:
+        """Jobs created at or after an ISO timestamp. Ex: 2025-05-01T00:00:00"""
+        ...
+
+    def close(self) -> None:
+        ...
@@ -0,0 +1,104 @@
+# pylint: disable=broad-exception-caught
+
+# Standard imports
+import asyncio
+import os
+from typing import Any
+
+# Local imports
+from scripts.storage.job_journal import JobJournal
+from scripts.storage.job_storage import JobStorage
+from utils.run_profiler import run_profiler
+
+# Flush when this many jobs are buffered or this many seconds have passed, whichever comes first
+BATCH_SIZE = int(os.getenv("SHEETS_BATCH_SIZE", "50"))
+FLUSH_INTERVAL_SECONDS = float(os.getenv("SHEETS_FLUSH_SECONDS", "10"))
+
+
+class JobWriter:
+    """Write-behind buffer that appends jobs to the storage from a worker thread.
+
+    Use as `async with JobWriter(storage) as writer:` and call `writer.put(jobs)`.
+    Everything still buffered is flushed when the block exits, including on error.
+    With a journal, jobs are journaled on put and marked stored after each flush,
+    so a run that dies before flushing loses nothing.
+    """
+
+    def __init__(
+        self,
+        storage: JobStorage,
+        journal: JobJournal | None = None,
+        batch_size: int = BATCH_SIZE,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        self.storage = storage
+        self.journal = journal
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer: list[dict[str, Any]] = []
+        self.new_jobs_count = 0
+        self._lock = asyncio.Lock()
+        self._wake = asyncio.Event()
+        self._closed = False
+        self._worker: asyncio.Task[None] | None = None
+
+    async def __aenter__(self):
+        self._worker = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info: Any):
+        # Let an in-flight append finish rather than cancelling it half-way
+        self._closed = True
+        self._wake.set()
+        if self._worker:
+            await self._worker
+
+        # Drain completely so nothing scraped so far is lost
+        await self.flush()
+
+    def put(
+        self,
+        jobs: list[dict[str, Any]],
+        page_num: int = 0,
+        journal: bool = True,
+        query_key: str = "",
+    ):
+        """Buffer jobs; pass journal=False for jobs replayed from the journal"""
+        if self.journal and journal:
+            for job in jobs:
+                self.journal.record_job(job, page_num, query_key)
+        self.buffer.extend(jobs)
+        if len(self.buffer) >= self.batch_size:
+            self._wake.set()
+
+    async def flush(self):
+        async with self._lock:
+            if not self.buffer:
+                return
+            batch, self.buffer = self.buffer, []
+            try:
+                # One batched append, off the event loop so the browser keeps going
+                with run_profiler.phase("storage_append"):
+                    new_jobs_count = await asyncio.to_thread(self.storage.append_batch, batch)
+            except Exception:
+                # Keep the batch for the next flush
+                self.buffer = batch + self.buffer
+                raise
+
+            self.new_jobs_count += new_jobs_count
+            if self.journal:
+                self.journal.record_stored(job["job_post_id"] for job in batch)
+            print(f"Flushed {len(batch)} jobs to storage, {new_jobs_count} new")
+
+    async def _run(self):
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Failed to flush jobs to storage, will retry: {e}")
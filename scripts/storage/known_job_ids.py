@@ -0,0 +1,19 @@
+from scripts.storage.job_storage import JobStorage
+
+
+class KnownJobIds:
+    """Job ids stored or scraped earlier in this run.
+
+    Ids scraped in this run are checked in memory, everything else is looked up in the storage,
+    so nothing has to be downloaded up front.
+    """
+
+    def __init__(self, storage: JobStorage):
+        self.storage = storage
+        self.run_ids: set[str] = set()
+
+    def __contains__(self, job_post_id: object):
+        return job_post_id in self.run_ids or self.storage.exists(str(job_post_id))
+
+    def add(self, job_post_id: str):
+        self.run_ids.add(job_post_id)
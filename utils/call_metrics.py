@@ -0,0 +1,61 @@
+# Standard imports
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+
+# Record call count and latency of every function decorated with handle_exceptions
+CALL_METRICS_ENABLED = os.getenv("CALL_METRICS", "").lower() == "true"
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket catches everything slower
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000, 10000)
+
+
+@dataclass
+class CallMetrics:
+    count: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+
+    def to_dict(self):
+        labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [
+            f">{LATENCY_BUCKETS_MS[-1]}ms"
+        ]
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "histogram": dict(zip(labels, self.buckets)),
+        }
+
+
+_metrics: dict[str, CallMetrics] = {}
+
+# Decorated functions also run in worker threads (e.g. write_to_sheets via asyncio.to_thread)
+_lock = threading.Lock()
+
+
+def record_call(name: str, start: float, failed: bool):
+    """Record one call that started at time.perf_counter() value `start`"""
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    bucket = next(
+        (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound),
+        len(LATENCY_BUCKETS_MS),
+    )
+    with _lock:
+        metrics = _metrics.setdefault(name, CallMetrics())
+        metrics.count += 1
+        metrics.errors += int(failed)
+        metrics.total_ms += elapsed_ms
+        metrics.max_ms = max(metrics.max_ms, elapsed_ms)
+        metrics.buckets[bucket] += 1
+
+
+def get_call_metrics():
+    """Snapshot of {function name: metrics}, slowest total time first"""
+    with _lock:
+        ranked = sorted(_metrics.items(), key=lambda item: item[1].total_ms, reverse=True)
+        return {name: metrics.to_dict() for name, metrics in ranked}
@@ -1,6 +1,31 @@
 import re
 
 from utils.handle_exceptions import handle_exceptions
+from utils.text_normalizer import TextNormalizer
+
+# Define patterns to remove
+# ,? means , or nothing
+# \s* means 0 or more spaces
+# .* means anything after the pattern
+COMPANY_NAME_PATTERNS = [
+    r",?\s*Inc\.?.*",  # Matches "Inc", "Inc.", ", Inc" and anything after
+    r",?\s*LLC\.?.*",  # Matches "LLC", "LLC.", ", LLC" and anything after
+    r"\.com.*",  # Matches ".com" and anything after
+    r"™.*",  # Matches trademark symbol and anything after
+    r"®.*",  # Matches registered symbol and anything after
+    r"\(.*\).*",  # Matches "(*)" and anything after
+]
+
+# All but the last cut everything after the first match, so one pass cutting at the earliest of them is the same.
+# "(*)" stays last and separate: "Acme (US, Inc)" has no ")" left once "Inc" is cut, so it must not match.
+MERGED_COMPANY_NAME_PATTERNS = [
+    r"(?:,?\s*(?:Inc|LLC)\.?|\.com|™|®).*",
+    r"\(.*\).*",
+]
+
+COMPANY_NAME_NORMALIZER = TextNormalizer(
+    COMPANY_NAME_PATTERNS, MERGED_COMPANY_NAME_PATTERNS, flags=re.IGNORECASE
+)
 
 
 @handle_exceptions(raise_on_error=True)
@@ -9,26 +34,15 @@ def clean_company_name(company_name: str):
         raise ValueError("Company name is required")
 
     # Convert to string and strip whitespace
-    company_name = str(company_name).strip()
-
-    # Define patterns to remove
-    # ,? means , or nothing
-    # \s* means 0 or more spaces
-    # .* means anything after the pattern
-    patterns = [
-        r",?\s*Inc\.?.*",  # Matches "Inc", "Inc.", ", Inc" and anything after
-        r",?\s*LLC\.?.*",  # Matches "LLC", "LLC.", ", LLC" and anything after
-        r"\.com.*",  # Matches ".com" and anything after
-        r"™.*",  # Matches trademark symbol and anything after
-        r"®.*",  # Matches registered symbol and anything after
-        r"\(.*\).*",  # Matches "(*)" and anything after
-    ]
-
-    # Apply all patterns
-    for pattern in patterns:
-        company_name = re.sub(pattern, "", company_name, flags=re.IGNORECASE)
-
-    # Clean up any remaining multiple spaces and trim
-    company_name = re.sub(r"\s+", " ", company_name).strip()
-
-    return company_name
+    return COMPANY_NAME_NORMALIZER.normalize(str(company_name).strip())
+
+
+@handle_exceptions(raise_on_error=True)
+def clean_company_names(company_names: list[str]):
+    """Clean a whole list of company names in one call, e.g. when backfilling the sheet"""
+    if not all(company_names):
+        raise ValueError("Company name is required")
+
+    return COMPANY_NAME_NORMALIZER.normalize_batch(
+        [str(company_name).strip() for company_name in company_names]
+    )
@@ -0,0 +1,12 @@
+from utils.handle_exceptions import handle_exceptions
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def clean_company_url(company_url: str | None):
+    if not company_url:
+        return None
+
+    # Ex1: https://www.linkedin.com/company/insight-global/life -> https://www.linkedin.com/company/insight-global/
+    # Ex2: https://www.linkedin.com/company/capgemini/?trk=abc -> https://www.linkedin.com/company/capgemini/
+    company_url = company_url.split("?")[0].split("/life")[0]
+    return company_url.rstrip("/") + "/"
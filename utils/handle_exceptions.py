@@ -2,73 +2,143 @@
 
 # Standard imports
 from functools import wraps
+import inspect
 import json
 import logging
+import time
 from typing import Any, Callable, Tuple, TypeVar
 
 # Third party imports
 import requests
 
-from utils.truncate_value import truncate_value
-
 # Local imports
+from utils.call_metrics import CALL_METRICS_ENABLED, record_call
+from utils.truncate_value import truncate_value
 
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def _handle_error(
+    func: Callable[..., Any],
+    err: Exception,
+    args: Tuple[Any, ...],
+    kwargs: dict[str, Any],
+    default_return_value: Any,
+    raise_on_error: bool,
+):
+    """Log err and re-raise it or return the default. Must be called from an except block."""
+    # Truncate args and kwargs only when there is something to log
+    truncated_args: list[Any] = [truncate_value(arg) for arg in args]
+    truncated_kwargs: dict[str, Any] = {
+        key: truncate_value(value) for key, value in kwargs.items()
+    }
+
+    if isinstance(err, requests.exceptions.HTTPError):
+        status_code: int = err.response.status_code
+
+        # Skip logging for 500 Internal Server Error as it's usually a temporary issue and no meaningful information is available
+        if status_code == 500:
+            if raise_on_error:
+                raise  # pylint: disable=misplaced-bare-raise
+            return default_return_value
+
+        reason: str | Any = err.response.reason
+        text: str | Any = err.response.text
+        print(f"reason: {reason}, text: {text}, status_code: {status_code}")
+
+        # Ex) 409: Conflict, 422: Unprocessable Entity (No changes made), and etc.
+        err_msg = f"{func.__name__} encountered an HTTPError: {err}\n\nArgs: {json.dumps(truncated_args, indent=2, default=str)}\n\nKwargs: {json.dumps(truncated_kwargs, indent=2, default=str)}\n\nReason: {reason}\n\nText: {text}\n\n"
+        logging.error(msg=err_msg)
+
+    elif isinstance(err, json.JSONDecodeError):
+        # Get the raw response that caused the JSON decode error
+        if hasattr(err, "doc"):
+            raw_response = err.doc
+        else:
+            raw_response = "Raw response not available"
+
+        err_msg = f"{func.__name__} encountered a JSONDecodeError: {err}\n\nRaw response: {raw_response}\n\nArgs: {json.dumps(truncated_args, indent=2, default=str)}\n\nKwargs: {json.dumps(truncated_kwargs, indent=2, default=str)}"
+        logging.error(msg=err_msg)
+
+    # Catch all other exceptions
+    else:
+        err_msg = f"{func.__name__} encountered an {type(err).__name__}: {err}\n\nArgs: {json.dumps(truncated_args, indent=2, default=str)}\n\nKwargs: {json.dumps(truncated_kwargs, indent=2, default=str)}"
+        logging.error(msg=err_msg)
+
+    if raise_on_error:
+        raise  # pylint: disable=misplaced-bare-raise
+    return default_return_value
+
+
 def handle_exceptions(
-    default_return_value: Any = None, raise_on_error: bool = False
+    default_return_value: Any = None,
+    raise_on_error: bool = False,
+    record_metrics: bool = CALL_METRICS_ENABLED,
 ) -> Callable[[F], F]:
+    """Log exceptions of sync functions, coroutines and async generators alike.
+
+    With record_metrics (CALL_METRICS=true), also record call count and latency per function.
+    """
+
     def decorator(func: F) -> F:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.isasyncgenfunction(func):
+
+            @wraps(func)
+            async def async_gen_wrapper(*args: Tuple[Any, ...], **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                failed = False
+                agen = func(*args, **kwargs)
+                try:
+                    async for item in agen:
+                        yield item
+                except Exception as err:
+                    failed = True
+                    # An async generator cannot return the default, it just stops
+                    _handle_error(
+                        func, err, args, kwargs, default_return_value, raise_on_error
+                    )
+                finally:
+                    await agen.aclose()
+                    if record_metrics:
+                        record_call(name, start, failed)
+
+            return async_gen_wrapper  # type: ignore[return-value]
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args: Tuple[Any, ...], **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                failed = False
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as err:
+                    failed = True
+                    return _handle_error(
+                        func, err, args, kwargs, default_return_value, raise_on_error
+                    )
+                finally:
+                    if record_metrics:
+                        record_call(name, start, failed)
+
+            return async_wrapper  # type: ignore[return-value]
+
         @wraps(func)
         def wrapper(*args: Tuple[Any, ...], **kwargs: Any) -> Any:
-            # Create truncated args and kwargs at the beginning
-            truncated_args: list[Any] = [truncate_value(arg) for arg in args]
-            truncated_kwargs: dict[str, Any] = {
-                key: truncate_value(value) for key, value in kwargs.items()
-            }
-
+            start = time.perf_counter()
+            failed = False
             try:
                 return func(*args, **kwargs)
-            except requests.exceptions.HTTPError as err:
-                status_code: int = err.response.status_code
-
-                # Skip logging for 500 Internal Server Error as it's usually a temporary issue and no meaningful information is available
-                if status_code == 500:
-                    if raise_on_error:
-                        raise
-                    return default_return_value
-
-                reason: str | Any = err.response.reason
-                text: str | Any = err.response.text
-                print(f"reason: {reason}, text: {text}, status_code: {status_code}")
-
-                # Ex) 409: Conflict, 422: Unprocessable Entity (No changes made), and etc.
-                err_msg = f"{func.__name__} encountered an HTTPError: {err}\n\nArgs: {json.dumps(truncated_args, indent=2)}\n\nKwargs: {json.dumps(truncated_kwargs, indent=2)}\n\nReason: {reason}\n\nText: {text}\n\n"
-                logging.error(msg=err_msg)
-
-                if raise_on_error:
-                    raise
-
-            except json.JSONDecodeError as err:
-                # Get the raw response that caused the JSON decode error
-                if hasattr(err, "doc"):
-                    raw_response = err.doc
-                else:
-                    raw_response = "Raw response not available"
-
-                err_msg = f"{func.__name__} encountered a JSONDecodeError: {err}\n\nRaw response: {raw_response}\n\nArgs: {json.dumps(truncated_args, indent=2)}\n\nKwargs: {json.dumps(truncated_kwargs, indent=2)}"
-                logging.error(msg=err_msg)
-                if raise_on_error:
-                    raise
-
-            # Catch all other exceptions
-            except (AttributeError, KeyError, TypeError, Exception) as err:
-                err_msg = f"{func.__name__} encountered an {type(err).__name__}: {err}\n\nArgs: {json.dumps(truncated_args, indent=2)}\n\nKwargs: {json.dumps(truncated_kwargs, indent=2)}"
-                logging.error(msg=err_msg)
-                if raise_on_error:
-                    raise
-            return default_return_value
+            except Exception as err:
+                failed = True
+                return _handle_error(
+                    func, err, args, kwargs, default_return_value, raise_on_error
+                )
+            finally:
+                if record_metrics:
+                    record_call(name, start, failed)
 
         return wrapper  # type: ignore[return-value]
 
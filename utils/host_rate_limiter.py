@@ -0,0 +1,23 @@
+# Standard imports
+import asyncio
+import time
+from collections import defaultdict
+from urllib.parse import urlparse
+
+
+class HostRateLimiter:
+    """Spaces out request starts per host. Ex: 2 requests per second -> one every 0.5 s per host"""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_start: defaultdict[str, float] = defaultdict(float)
+        self._locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def wait(self, url: str):
+        """Return once a request to url's host may start"""
+        host = urlparse(url).hostname or ""
+        async with self._locks[host]:
+            delay = self._next_start[host] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_start[host] = time.monotonic() + self.interval
@@ -0,0 +1,118 @@
+# Standard imports
+import math
+import os
+from dataclasses import dataclass
+from datetime import datetime
+
+# Local imports
+from utils.local_cache import load_cache, save_cache
+
+CACHE_NAME = "keyword_stats.json"
+
+# Weight of the latest run in each moving average, the rest is history
+STATS_WEIGHT = float(os.getenv("KEYWORD_STATS_WEIGHT", "0.3"))
+
+# Floor on the new-jobs-per-hour estimate, so a keyword that found nothing lately still gains
+# score while it waits, and a keyword idle this long is run next regardless of its score
+MIN_JOBS_PER_HOUR = float(os.getenv("KEYWORD_MIN_JOBS_PER_HOUR", "0.1"))
+MAX_IDLE_HOURS = float(os.getenv("KEYWORD_MAX_IDLE_HOURS", "72"))
+
+# Shortest cost assumed for a run, so a run that failed fast does not look free
+MIN_RUN_MINUTES = 0.5
+
+
+@dataclass
+class KeywordScore:
+    """Why a keyword ranks where it does, printed by select_keyword --explain"""
+
+    keyword: str
+    # "unexplored" (no yield estimate yet), "overdue" (idle past MAX_IDLE_HOURS) or "scored"
+    reason: str
+    idle_hours: float
+    jobs_per_hour: float | None
+    minutes_per_run: float | None
+    # Expected new jobs per browser-minute if the keyword runs now
+    score: float
+
+    @property
+    def priority(self):
+        """Sort key: unexplored first, then overdue (longest idle first), then by score"""
+        tier = {"unexplored": 0, "overdue": 1, "scored": 2}[self.reason]
+        return (tier, -self.idle_hours if self.reason == "overdue" else -self.score)
+
+
+def load_keyword_stats() -> dict[str, dict[str, float | str]]:
+    return load_cache(CACHE_NAME) or {}
+
+
+def record_keyword_run(keyword: str, new_jobs: int, cards_scanned: int, seconds: float):
+    """Fold one finished run into the keyword's moving averages.
+
+    New postings accumulate between runs, so the yield is tracked as new jobs per hour since
+    the previous run rather than per run. Ex: 12 new jobs 6 hours after the last run -> 2/hour
+    """
+    all_stats = load_keyword_stats()
+    stats = all_stats.get(keyword, {})
+    now = datetime.now()
+
+    def average(name: str, value: float):
+        previous = stats.get(name)
+        if previous is None:
+            return value
+        return STATS_WEIGHT * value + (1 - STATS_WEIGHT) * float(previous)
+
+    updated: dict[str, float | str] = {
+        "runs": int(stats.get("runs", 0)) + 1,
+        "last_run_at": now.isoformat(),
+        "new_jobs": average("new_jobs", new_jobs),
+        "cards_scanned": average("cards_scanned", cards_scanned),
+        "minutes_per_run": average("minutes_per_run", seconds / 60),
+    }
+
+    # The first run has no previous run to measure the arrival rate against
+    if "last_run_at" in stats:
+        hours = (now - datetime.fromisoformat(str(stats["last_run_at"]))).total_seconds() / 3600
+        updated["jobs_per_hour"] = average("jobs_per_hour", new_jobs / max(hours, 1 / 60))
+
+    all_stats[keyword] = updated
+    save_cache(CACHE_NAME, all_stats)
+    print(
+        f"Recorded run for '{keyword}': {new_jobs} new jobs, {cards_scanned} cards in {seconds:.0f}s"
+    )
+
+
+def score_keyword(keyword: str, stats: dict[str, float | str] | None, now: datetime):
+    if not stats or "jobs_per_hour" not in stats:
+        idle_hours = math.inf
+        if stats:
+            idle_hours = (now - datetime.fromisoformat(str(stats["last_run_at"]))).total_seconds() / 3600
+        return KeywordScore(keyword, "unexplored", idle_hours, None, None, math.inf)
+
+    idle_hours = (now - datetime.fromisoformat(str(stats["last_run_at"]))).total_seconds() / 3600
+    jobs_per_hour = float(stats["jobs_per_hour"])
+    minutes_per_run = float(stats["minutes_per_run"])
+    expected_new_jobs = max(jobs_per_hour, MIN_JOBS_PER_HOUR) * idle_hours
+    score = expected_new_jobs / max(minutes_per_run, MIN_RUN_MINUTES)
+    reason = "overdue" if idle_hours >= MAX_IDLE_HOURS else "scored"
+    return KeywordScore(keyword, reason, idle_hours, jobs_per_hour, minutes_per_run, score)
+
+
+def rank_keywords(keywords: list[str], now: datetime | None = None):
+    """Keywords best first. Ties keep keywords.json order, so a fresh cache runs them in order"""
+    now = now or datetime.now()
+    all_stats = load_keyword_stats()
+    scores = [score_keyword(keyword, all_stats.get(keyword), now) for keyword in keywords]
+    return sorted(scores, key=lambda score: score.priority)
+
+
+def explain_ranking(scores: list[KeywordScore]):
+    """Ex: 1. SDET  scored  idle 6.0h  2.10 jobs/h  1.8 min/run  score 7.00"""
+    lines = [f"Keyword ranking (stats in {CACHE_NAME}):"]
+    for rank, score in enumerate(scores, start=1):
+        jobs_per_hour = "-" if score.jobs_per_hour is None else f"{score.jobs_per_hour:.2f}"
+        minutes = "-" if score.minutes_per_run is None else f"{score.minutes_per_run:.1f}"
+        lines.append(
+            f"{rank:>2}. {score.keyword:<28} {score.reason:<10} idle {score.idle_hours:>6.1f}h"
+            f"  {jobs_per_hour:>6} jobs/h  {minutes:>5} min/run  score {score.score:.2f}"
+        )
+    return "\n".join(lines)
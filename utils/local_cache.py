@@ -0,0 +1,41 @@
+# Standard imports
+import json
+import os
+import tempfile
+from typing import Any
+
+# Local imports
+from utils.handle_exceptions import handle_exceptions
+
+# Same switch as scripts/linkedin/har_session.py, read here so utils stays free of scripts imports
+REPLAY = os.getenv("HAR_MODE", "").lower() == "replay"
+
+# Local state that should survive between runs (persisted by actions/cache in GitHub Actions).
+# A HAR replay writes its journal, watermarks and stats to a scratch dir, never to the real cache.
+REPLAY_CACHE_DIR = os.path.join(tempfile.gettempdir(), "job-posting-scraper-replay")
+CACHE_DIR = REPLAY_CACHE_DIR if REPLAY else os.getenv("CACHE_DIR", ".cache")
+
+
+def get_cache_path(name: str):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, name)
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def load_cache(name: str):
+    """Load a JSON cache file, returning None if it does not exist yet"""
+    path = get_cache_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@handle_exceptions(default_return_value=None, raise_on_error=False)
+def save_cache(name: str, data: Any):
+    # Write to a temp file first so a crash mid-write never leaves a corrupt cache
+    path = get_cache_path(name)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
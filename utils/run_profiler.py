@@ -0,0 +1,106 @@
+# Standard imports
+import json
+import math
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+
+# Local imports
+from utils.call_metrics import CALL_METRICS_ENABLED, get_call_metrics
+
+# Time each phase of the run and print a JSON summary at the end
+PROFILE_RUN = os.getenv("PROFILE_RUN", "").lower() == "true"
+
+# Also write the summary to this file, e.g. for a GitHub Actions artifact
+PROFILE_OUTPUT = os.getenv("PROFILE_OUTPUT", "")
+
+# Returned by phase() when profiling is off, so a disabled phase is one attribute check
+_NO_PHASE = nullcontext()
+
+
+def get_percentile(sorted_values: list[float], percentile: float):
+    """Nearest-rank percentile. Ex: p50 of [1, 2, 3, 4] -> 2"""
+    return sorted_values[max(math.ceil(percentile / 100 * len(sorted_values)) - 1, 0)]
+
+
+class _Phase:
+    def __init__(self, durations: list[float]):
+        self.durations = durations
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: object):
+        self.durations.append(time.perf_counter() - self.start)
+
+
+class RunProfiler:
+    """Durations per phase and counters for one run. Ex: `with run_profiler.phase("scroll"):`"""
+
+    def __init__(self, enabled: bool = PROFILE_RUN):
+        self.enabled = enabled
+        self.started_at = time.perf_counter()
+        self.durations: defaultdict[str, list[float]] = defaultdict(list)
+        self.counters: Counter[str] = Counter()
+
+    def phase(self, name: str):
+        if not self.enabled:
+            return _NO_PHASE
+        return _Phase(self.durations[name])
+
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            self.counters[name] += amount
+
+    def summary(self):
+        elapsed = time.perf_counter() - self.started_at
+        phases = {}
+        for name, durations in self.durations.items():
+            ordered = sorted(durations)
+            phases[name] = {
+                "count": len(ordered),
+                "total_ms": round(sum(ordered) * 1000, 1),
+                "p50_ms": round(get_percentile(ordered, 50) * 1000, 1),
+                "p95_ms": round(get_percentile(ordered, 95) * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            }
+
+        summary = {
+            "elapsed_seconds": round(elapsed, 2),
+            "counters": dict(self.counters),
+            "pages_per_second": round(self.counters["pages"] / elapsed, 3),
+            "cards_per_second": round(self.counters["cards_scanned"] / elapsed, 3),
+            "phases": phases,
+        }
+        if CALL_METRICS_ENABLED:
+            summary["calls"] = get_call_metrics()
+        return summary
+
+    def slack_line(self):
+        """One line for the Slack message. Ex: Profile: 4 pages, 100 cards in 95s (1.05 cards/s)"""
+        summary = self.summary()
+        slowest = max(summary["phases"].items(), key=lambda item: item[1]["total_ms"], default=None)
+        line = (
+            f"Profile: {summary['counters'].get('pages', 0)} pages, "
+            f"{summary['counters'].get('cards_scanned', 0)} cards in {summary['elapsed_seconds']:.0f}s "
+            f"({summary['cards_per_second']} cards/s)"
+        )
+        if slowest:
+            line += f", slowest phase: {slowest[0]} ({slowest[1]['total_ms'] / 1000:.1f}s)"
+        return line
+
+    def report(self, output_path: str = PROFILE_OUTPUT):
+        if not self.enabled:
+            return
+        report = json.dumps(self.summary(), indent=2)
+        print(report)
+        if output_path:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(report)
+
+
+# Shared by every module of the run
+run_profiler = RunProfiler()
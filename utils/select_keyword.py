@@ -2,9 +2,23 @@
 import json
 import os
 import sys
-import datetime
 
 from utils.handle_exceptions import handle_exceptions
+from utils.keyword_scheduler import explain_ranking, rank_keywords
+
+
+def load_keywords() -> list[str]:
+    with open("keywords.json", "r", encoding="utf-8") as keyword_file:
+        return json.load(keyword_file)
+
+
+@handle_exceptions(raise_on_error=True)
+def select_keywords(count: int = 1, explain: bool = False):
+    """The next `count` keywords to run: most expected new jobs per browser-minute first"""
+    scores = rank_keywords(load_keywords())
+    if explain:
+        print(explain_ranking(scores))
+    return [score.keyword for score in scores[:count]]
 
 
 @handle_exceptions(raise_on_error=True)
@@ -12,32 +26,23 @@ def select_keyword(event_name: str | None = None):
     """
     Select a keyword based on various criteria:
     - For manual runs (workflow_dispatch): Use the first keyword
-    - For scheduled runs: Select based on current hour
+    - For scheduled runs: Use the keyword ranked first by keyword_scheduler
     """
-    # Load keywords from JSON file
-    with open("keywords.json", "r", encoding="utf-8") as keyword_file:
-        keywords: list[str] = json.load(keyword_file)
-
     # For manual runs use the first keyword
-    selected_keyword = keywords[0]
     if event_name == "workflow_dispatch":
-        return selected_keyword
-
-    # For scheduled runs, calculate based on time
-    hour = datetime.datetime.now(datetime.UTC).hour
-    run_interval = 24 // len(keywords)
+        return load_keywords()[0]
 
-    # Select keyword based on current time
-    index = hour // run_interval
-    selected_keyword = keywords[index]
-
-    print(
-        f"Selected keyword '{selected_keyword}' (index {index}) based on current hour {hour}"
-    )
+    selected_keyword = select_keywords()[0]
+    print(f"Selected keyword '{selected_keyword}' by expected new jobs per minute", file=sys.stderr)
     return selected_keyword
 
 
 if __name__ == "__main__":
+    # Show the ranking without selecting anything with: python -m utils.select_keyword --explain
+    if "--explain" in sys.argv[1:]:
+        select_keywords(explain=True)
+        sys.exit(0)
+
     # Optional argument for event type
     cli_event_type = sys.argv[1] if len(sys.argv) > 1 else None
     result = select_keyword(cli_event_type)
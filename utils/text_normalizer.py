@@ -0,0 +1,38 @@
+import os
+import re
+from functools import lru_cache
+
+# Distinct inputs remembered per normalizer; titles and company names repeat across pages and keywords
+NORMALIZE_CACHE_SIZE = int(os.getenv("NORMALIZE_CACHE_SIZE", "4096"))
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class TextNormalizer:
+    """Remove patterns from text, then collapse whitespace. Results are memoized per input."""
+
+    def __init__(
+        self,
+        patterns: list[str],
+        merged_patterns: list[str],
+        flags: int = 0,
+        cache_size: int = NORMALIZE_CACHE_SIZE,
+    ):
+        # Applied one after another, in order, like a chain of re.sub calls
+        self.patterns = [re.compile(pattern, flags) for pattern in patterns]
+
+        # Fewer passes giving the same result as `patterns` on single-line text.
+        # "." does not match "\n", so text with line breaks falls back to `patterns`.
+        self.merged_patterns = [re.compile(pattern, flags) for pattern in merged_patterns]
+
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    def _normalize(self, text: str):
+        patterns = self.patterns if "\n" in text else self.merged_patterns
+        for pattern in patterns:
+            text = pattern.sub("", text)
+        return WHITESPACE_PATTERN.sub(" ", text).strip()
+
+    def normalize_batch(self, texts: list[str]):
+        normalize = self.normalize
+        return [normalize(text) for text in texts]